@@ -35,5 +35,15 @@ class ArchiveCommandTest(CommandTest):
         self.assertEqual(todolist.print_todos(), "x Not complete\n(C) Active")
         self.assertEqual(archive.print_todos(), "x 2014-10-19 Complete\nx 2014-10-20 Another one complete")
 
+    def test_archive_nothing(self):
+        todolist = TodoList(["Not complete"])
+        archive = TodoList([])
+
+        command = ArchiveCommand(todolist, archive)
+        command.execute()
+
+        self.assertFalse(todolist.is_dirty())
+        self.assertFalse(archive.is_dirty())
+
 if __name__ == '__main__':
     unittest.main()
@@ -48,6 +48,11 @@ class ConfigTest(TopydoTest):
         self.assertEqual(config("test/data/ConfigTest4.conf").colors(),
                          bool(int(config().defaults["topydo"]["colors"])))
 
+    def test_config05b(self):
+        """ Bad atomic_write value. """
+        self.assertEqual(config("test/data/ConfigTest4.conf").atomic_write(),
+                         bool(int(config().defaults["topydo"]["atomic_write"])))
+
     def test_config06(self):
         """ Bad auto creation date switch value. """
         self.assertEqual(config("test/data/ConfigTest4.conf").auto_creation_date(),
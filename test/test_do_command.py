@@ -205,6 +205,21 @@ class DoCommandTest(CommandTest):
         self.assertEqual(self.output, "Completed: x {} Subtodo of inactive p:2\n".format(self.today))
         self.assertEqual(self.errors, "")
 
+    def test_activated_todos3(self):
+        """
+        Completing a subtodo may activate another parent of that subtodo.
+        """
+        todolist = TodoList(["Parent1 id:1", "Parent2 id:2", "Child p:1 p:2"])
+
+        command = DoCommand(["1"], todolist, self.out, self.error,
+                            _yes_prompt)
+        command.execute()
+
+        result = "|  3| Child p:1 p:2\nCompleted: x {today} Child p:1 p:2\nCompleted: x {today} Parent1 id:1\nThe following todo item(s) became active:\n|  2| Parent2 id:2\n".format(today=self.today)
+
+        self.assertEqual(self.output, result)
+        self.assertEqual(self.errors, "")
+
     def test_already_complete(self):
         command = DoCommand(["5"], self.todolist, self.out, self.error)
         command.execute()
@@ -78,6 +78,23 @@ class FilterTest(TopydoTest):
         self.assertEqual(todolist_to_string(filtered_todos),
                          todolist_to_string(reference))
 
+    def test_filter07b(self):
+        """ The dependency filter agrees with matching single items. """
+        todolist = load_file_to_todolist('test/data/FilterTest2.txt')
+        todolist.add("Cycle 1 id:7 p:8")
+        todolist.add("Cycle 2 id:8 p:7")
+        todolist.add("x 2014-07-20 Done cycle 1 id:9 p:10")
+        todolist.add("x 2014-07-20 Done cycle 2 id:10 p:9")
+        depfilter = Filter.DependencyFilter(todolist)
+
+        filtered_todos = depfilter.filter(todolist.todos())
+        matched_todos = [t for t in todolist.todos() if depfilter.match(t)]
+
+        self.assertEqual(filtered_todos, matched_todos)
+        self.assertEqual(todolist_to_string(filtered_todos[-2:]),
+                         "x 2014-07-20 Done cycle 1 id:9 p:10\n"
+                         "x 2014-07-20 Done cycle 2 id:10 p:9")
+
     def test_filter08(self):
         """ Test case sensitive match (forced, with lowercase). """
         todos = load_file('test/data/FilterTest1.txt')
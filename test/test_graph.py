@@ -144,12 +144,78 @@ class GraphTest(TopydoTest):
         self.assertFalse(self.graph.has_edge(3, 5))
         self.assertFalse(self.graph.has_path(1, 5))
 
+    def test_remove_node4(self):
+        """ Edge ids of the edges of a removed node are forgotten. """
+        self.graph.remove_node(2)
+
+        self.assertFalse(self.graph.has_edge_id(1))
+        self.assertFalse(self.graph.has_edge_id("Test"))
+        self.assertEqual(self.graph.incoming_neighbors(4), set())
+
+    def test_edge_id_shared(self):
+        """ An edge id remains registered while an edge carries it. """
+        self.graph.add_edge(5, 7, "Test")
+        self.graph.remove_edge(2, 4)
+
+        self.assertTrue(self.graph.has_edge_id("Test"))
+
+        self.graph.remove_edge(5, 7)
+
+        self.assertFalse(self.graph.has_edge_id("Test"))
+
+    def test_is_isolated(self):
+        self.graph.add_node(7)
+
+        self.assertTrue(self.graph.is_isolated(7))
+        self.assertFalse(self.graph.is_isolated(5))
+        self.assertFalse(self.graph.is_isolated(1))
+
     def test_transitive_reduce1(self):
         self.graph.transitively_reduce()
 
         self.assertTrue(self.graph.has_edge(4, 3))
         self.assertFalse(self.graph.has_edge(1, 3))
 
+    def test_transitive_reduce2(self):
+        """ Reduce a graph where children are on a cycle. """
+        graph = DirectedGraph()
+        graph.add_edge(1, 2)
+        graph.add_edge(1, 3)
+        graph.add_edge(2, 3)
+        graph.add_edge(3, 2)
+
+        graph.transitively_reduce()
+
+        # one of both edges must be kept, 2 and 3 remain reachable
+        self.assertEqual(len(graph.outgoing_neighbors(1)), 1)
+        self.assertEqual(graph.outgoing_neighbors(1, True), set([2, 3]))
+
+    def test_transitive_reduce3(self):
+        """ Reduce a long chain with shortcuts to every node. """
+        graph = DirectedGraph()
+        for i in range(1, 200):
+            graph.add_edge(i, i + 1)
+            graph.add_edge(1, i + 1)
+
+        graph.transitively_reduce()
+
+        self.assertEqual(graph.outgoing_neighbors(1), set([2]))
+        self.assertEqual(graph.outgoing_neighbors(1, True),
+                         set(range(2, 201)))
+
+    def test_transitive_reduce4(self):
+        """ Edges into a cycle with the parent itself are kept. """
+        graph = DirectedGraph()
+        graph.add_edge(1, 2)
+        graph.add_edge(2, 3)
+        graph.add_edge(3, 1)
+        graph.add_edge(1, 3)
+
+        graph.transitively_reduce()
+
+        self.assertTrue(graph.has_edge(1, 2))
+        self.assertTrue(graph.has_edge(1, 3))
+
     def test_add_double_edge(self):
         self.graph.add_edge(1, 3)
         self.graph.remove_edge(1, 3)
@@ -19,6 +19,7 @@ from datetime import date, timedelta
 from freezegun import freeze_time
 
 from test.topydo_testcase import TopydoTest
+from topydo.lib.Clock import clock
 from topydo.lib.Config import config
 from topydo.lib.Importance import importance
 from topydo.lib.Todo import Todo
@@ -56,5 +57,13 @@ class ImportanceTest(TopydoTest):
         todo = Todo("(C) Foo " + config().tag_due() + ":" + "2015-11-09")
         self.assertEqual(importance(todo), 6)
 
+
+class ImportanceClockTest(TopydoTest):
+    def test_importance_clock(self):
+        clock(date(2015, 11, 6))
+        config(p_overrides={('sort', 'ignore_weekends'): '1'})
+        todo = Todo("(C) Foo " + config().tag_due() + ":" + "2015-11-09")
+        self.assertEqual(importance(todo), 6)
+
 if __name__ == '__main__':
     unittest.main()
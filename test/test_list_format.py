@@ -17,12 +17,17 @@
 import unittest
 
 from collections import namedtuple
+from datetime import date
 from freezegun import freeze_time
 
 from test.command_testcase import CommandTest
 from test.facilities import load_file_to_todolist
+from test.topydo_testcase import TopydoTest
 from topydo.commands.ListCommand import ListCommand
+from topydo.lib.Clock import clock
 from topydo.lib.Config import config
+from topydo.lib.ListFormat import humanize_date
+from topydo.lib.TodoList import TodoList
 
 # We're searching for 'mock'
 # 'mock' was added as 'unittest.mock' in Python 3.3, but PyPy 3 is based on Python 3.2
@@ -691,6 +696,99 @@ x 2014-12-12 Completed but with date:2014-12-12
 """
         self.assertEqual(self.output, result)
 
+    def test_list_format46(self):
+        """ Backslashes in the todo item's text are printed as-is. """
+        todolist = TodoList(["Foo 50\\% off", "Bar \\1 \\g<0>"])
+        command = ListCommand(["-F", "%{[}s{]} %i"], todolist, self.out, self.error)
+        command.execute()
+
+        result = """[Foo 50\\% off] 1
+[Bar \\1 \\g<0>] 2
+"""
+        self.assertEqual(self.output, result)
+
+    @mock.patch('topydo.lib.ListFormat.get_terminal_size')
+    def test_list_format47(self, mock_terminal_size):
+        """ Long lines without text are not truncated. """
+        mock_terminal_size.return_value = self.terminal_size(20, 25)
+
+        todolist = TodoList(["(A) key:value another:value"])
+        command = ListCommand(["-F", "%p %S %K"], todolist, self.out, self.error)
+        command.execute()
+
+        self.assertEqual(self.output, "A another:value key:value\n")
+
+    @mock.patch('topydo.lib.ListFormat.get_terminal_size')
+    def test_list_format48(self, mock_terminal_size):
+        """ The terminal size is only determined once per listing. """
+        mock_terminal_size.return_value = self.terminal_size(100, 25)
+
+        command = ListCommand(["-x", "-F", "|%I| %x %{(}p{)} %c %S\\t%K"], self.todolist, self.out, self.error)
+        command.execute()
+
+        self.assertEqual(mock_terminal_size.call_count, 1)
+
+    @mock.patch('topydo.lib.ListFormat.get_terminal_size')
+    def test_list_format49(self, mock_terminal_size):
+        """ An explicit width takes precedence over the terminal size. """
+        mock_terminal_size.return_value = self.terminal_size(100, 25)
+
+        command = ListCommand(["-x", "-w", "40", "-F", "|%I| %S\\t%p"], self.todolist, self.out, self.error)
+        command.execute()
+
+        result = """|  1| Bar @Context1 +Project2         D
+|  2| Lorem ipsum dolorem sit amet... Z
+|  3| Foo @Context2 Not@Context +P... C
+|  4| Baz @Context1 +Project1         C
+|  5| Drink beer @ home
+|  6| Completed but with
+"""
+        self.assertFalse(mock_terminal_size.called)
+        self.assertEqual(self.output, result)
+
+    @mock.patch('topydo.lib.ListFormat.get_terminal_size')
+    def test_list_format50(self, mock_terminal_size):
+        """ A width that is too small is ignored. """
+        mock_terminal_size.return_value = self.terminal_size(40, 25)
+
+        command = ListCommand(["-x", "-w", "5", "-F", "|%I| %S\\t%p"], self.todolist, self.out, self.error)
+        command.execute()
+
+        result = """|  1| Bar @Context1 +Project2         D
+|  2| Lorem ipsum dolorem sit amet... Z
+|  3| Foo @Context2 Not@Context +P... C
+|  4| Baz @Context1 +Project1         C
+|  5| Drink beer @ home
+|  6| Completed but with
+"""
+        self.assertTrue(mock_terminal_size.called)
+        self.assertEqual(self.output, result)
+
+
+class HumanizeDateTest(TopydoTest):
+    def setUp(self):
+        super().setUp()
+        clock(date(2015, 11, 6))
+
+    def test_humanize_days(self):
+        self.assertEqual(humanize_date(date(2015, 11, 6)), 'today')
+        self.assertEqual(humanize_date(date(2015, 11, 7)), 'in a day')
+        self.assertEqual(humanize_date(date(2015, 11, 5)), 'a day ago')
+        self.assertEqual(humanize_date(date(2015, 11, 8)), 'in 2 days')
+        self.assertEqual(humanize_date(date(2015, 10, 8)), '29 days ago')
+
+    def test_humanize_months(self):
+        self.assertEqual(humanize_date(date(2015, 10, 7)), 'a month ago')
+        self.assertEqual(humanize_date(date(2015, 12, 20)), 'in a month')
+        self.assertEqual(humanize_date(date(2015, 12, 21)), 'in 2 months')
+        self.assertEqual(humanize_date(date(2015, 8, 31)), '3 months ago')
+        self.assertEqual(humanize_date(date(2016, 10, 10)), 'in 11 months')
+
+    def test_humanize_years(self):
+        self.assertEqual(humanize_date(date(2016, 10, 16)), 'in a year')
+        self.assertEqual(humanize_date(date(2014, 5, 9)), 'a year ago')
+        self.assertEqual(humanize_date(date(2014, 5, 8)), '2 years ago')
+        self.assertEqual(humanize_date(date(2005, 11, 6)), '10 years ago')
 
 if __name__ == '__main__':
     unittest.main()
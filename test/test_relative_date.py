@@ -19,6 +19,7 @@ from datetime import date
 from freezegun import freeze_time
 
 from test.topydo_testcase import TopydoTest
+from topydo.lib.Clock import clock
 from topydo.lib.RelativeDate import relative_date_to_date
 
 
@@ -180,5 +181,23 @@ class RelativeDateTester(TopydoTest):
         result = relative_date_to_date("fri")
         self.assertTrue(result, self.friday)
 
+
+class RelativeDateClockTester(TopydoTest):
+    def setUp(self):
+        super().setUp()
+        clock(date(2016, 2, 29))
+
+    def test_clock_today(self):
+        result = relative_date_to_date('today')
+        self.assertEqual(result, date(2016, 2, 29))
+
+    def test_clock_period(self):
+        result = relative_date_to_date('1m')
+        self.assertEqual(result, date(2016, 3, 29))
+
+    def test_clock_weekday(self):
+        result = relative_date_to_date('mon')
+        self.assertEqual(result, date(2016, 3, 7))
+
 if __name__ == '__main__':
     unittest.main()
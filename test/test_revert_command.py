@@ -32,6 +32,7 @@ from topydo.lib.ChangeSet import ChangeSet
 from topydo.lib.Config import config
 from topydo.lib.TodoFile import TodoFile
 from topydo.lib.TodoList import TodoList
+from topydo.lib.TodoListBase import TodoListBase
 
 class RevertCommandTest(CommandTest):
     def setUp(self):
@@ -113,6 +114,33 @@ class RevertCommandTest(CommandTest):
         self.assertEqual(result, "x {} Foo".format(self.today))
         self.assertEqual(self.todolist.print_todos(), "Bar\nBaz")
 
+    def test_revert_archive(self):
+        """ Archiving after a revert doesn't leave a blank line behind. """
+        todolist = TodoList(["Foo", "x 2015-01-01 Done", "Bar"])
+        backup = ChangeSet(todolist, self.archive, ['add New'])
+        backup.timestamp = '1'
+        command = AddCommand(["New"], todolist, self.out, self.error, None)
+        command.execute()
+        archive_command = ArchiveCommand(todolist, self.archive)
+        archive_command.execute()
+        self.archive_file.write(self.archive.print_todos())
+        backup.save(todolist)
+
+        revert_command = RevertCommand([], todolist, self.out, self.error, None)
+        revert_command.execute()
+
+        # the revert is not backed up, so done.txt is appended to
+        archive = TodoListBase([])
+        archive_command = ArchiveCommand(todolist, archive)
+        archive_command.execute()
+        self.archive_file.append(archive.print_todos())
+
+        with open(self.archive_file.path) as archive_file:
+            self.assertEqual(archive_file.read(), "x 2015-01-01 Done\n")
+
+        self.assertEqual(self.errors, "")
+        self.assertEqual(todolist.print_todos(), "Foo\nBar")
+
     def test_revert03(self):
         """ Test behavior when no backup is found """
         command = RevertCommand([], self.todolist, self.out, self.error)
@@ -21,6 +21,7 @@ from test.facilities import (load_file, load_file_to_todolist, print_view,
 from test.topydo_testcase import TopydoTest
 from topydo.lib.Config import config
 from topydo.lib.Sorter import Sorter
+from topydo.lib.Todo import Todo
 
 
 class SorterTest(TopydoTest):
@@ -188,6 +189,22 @@ class SorterTest(TopydoTest):
         self.sort_file('test/data/SorterTest13.txt',
                        'test/data/SorterTest13-result-context.txt', sorter)
 
+    def test_sort19(self):
+        """
+        Mix descending text fields with ascending fields, items with equal
+        keys keep their order.
+        """
+        todos = [Todo("a due:2015-01-02"), Todo("b due:2015-01-01"),
+                 Todo("a due:2015-01-01"), Todo("b due:2015-01-01 foo:1"),
+                 Todo("b due:2015-01-01 foo:2")]
+
+        sorted_todos = Sorter('desc:text,due').sort(todos)
+
+        self.assertEqual([t.source() for t in sorted_todos],
+                         ["b due:2015-01-01", "b due:2015-01-01 foo:1",
+                          "b due:2015-01-01 foo:2", "a due:2015-01-01",
+                          "a due:2015-01-02"])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,98 @@
+# Topydo - A todo.txt client written in Python.
+# Copyright (C) 2014 - 2015 Bram Schoenmakers <me@bramschoenmakers.nl>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from uuid import uuid4
+
+from test.topydo_testcase import TopydoTest
+
+# modules that should not be loaded for listing the todo items
+UNNEEDED_MODULES = (
+    'arrow',
+    'calendar',
+    'hashlib',
+    'json',
+    'shutil',
+    'topydo.lib.ChangeSet',
+    'topydo.lib.HashListValues',
+)
+
+# maximum time (in microseconds) to import the modules for 'topydo ls',
+# generous enough for slow machines and interpreters without bytecode cache
+STARTUP_BUDGET = 200000
+
+
+def _import_times(p_args):
+    """
+    Runs Python with the given arguments and returns a dictionary with the
+    self time (in microseconds) spent on importing each module.
+    """
+    process = subprocess.Popen(
+        [sys.executable, '-X', 'importtime'] + p_args,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    _, errors = process.communicate()
+
+    result = {}
+
+    for line in errors.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_time, _, module = line[len('import time:'):].split('|')
+        result[module.strip()] = int(self_time)
+
+    return result
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "-X importtime requires Python 3.7")
+class StartupTest(TopydoTest):
+    def setUp(self):
+        super().setUp()
+        self.todo_filename = os.path.join(
+            tempfile.gettempdir(), str(uuid4().hex.upper()[0:6]) + '_todo')
+        open(self.todo_filename, 'w').close()
+
+        self.interpreter = _import_times(['-c', 'pass'])
+        self.topydo = _import_times([
+            '-c', 'from topydo.cli.UILoader import main; main()',
+            '-c', 'test/data/startup.conf', '-t', self.todo_filename, 'ls'])
+
+    def tearDown(self):
+        os.remove(self.todo_filename)
+        super().tearDown()
+
+    def test_startup_modules(self):
+        self.assertIn('topydo.commands.ListCommand', self.topydo)
+
+        for module in UNNEEDED_MODULES:
+            if module not in self.interpreter:
+                self.assertFalse(module in self.topydo,
+                                 module + " should not be imported")
+
+    def test_startup_budget(self):
+        startup_time = sum(time for module, time in self.topydo.items()
+                           if module not in self.interpreter)
+
+        self.assertLess(startup_time, STARTUP_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,6 +18,7 @@ import unittest
 from datetime import date, timedelta
 
 from test.topydo_testcase import TopydoTest
+from topydo.lib.Clock import clock
 from topydo.lib.Todo import Todo
 
 
@@ -114,5 +115,62 @@ class TodoTest(TopydoTest):
         todo = Todo("(C) 2015-11-18 Foo due:2015-11-16)")
         self.assertEqual(todo.length(), 0)
 
+    def test_clock1(self):
+        clock(date(2015, 11, 18))
+        todo = Todo("Foo t:2015-11-19 due:2015-11-20")
+        self.assertFalse(todo.is_active())
+        self.assertEqual(todo.days_till_due(), 2)
+
+    def test_clock2(self):
+        clock(date(2015, 11, 21))
+        todo = Todo("Foo t:2015-11-19 due:2015-11-20")
+        self.assertTrue(todo.is_active())
+        self.assertTrue(todo.is_overdue())
+
+    def test_lazy1(self):
+        src = "(A) 2015-11-01 Foo +Project @Context due:2015-11-16"
+        todo = Todo(src, True)
+
+        self.assertEqual(todo.source(), src)
+        self.assertEqual(todo.fields, Todo(src).fields)
+        self.assertEqual(todo.due_date(), date(2015, 11, 16))
+
+    def test_lazy2(self):
+        todo = Todo("x 2015-11-16 Foo", True)
+        self.assertTrue(todo.is_completed())
+        self.assertEqual(todo.completion_date(), date(2015, 11, 16))
+
+    def test_lazy3(self):
+        todo = Todo("Foo due:2015-11-16", True)
+        todo.set_tag('due', '2015-11-17')
+
+        self.assertEqual(todo.source(), "Foo due:2015-11-17")
+        self.assertEqual(todo.due_date(), date(2015, 11, 17))
+
+    def test_lazy4(self):
+        todo = Todo("Foo", True)
+        todo.set_completed(date(2015, 11, 16))
+
+        self.assertEqual(todo.source(), "x 2015-11-16 Foo")
+        self.assertEqual(todo.text(), "Foo")
+
+    def test_date_cache1(self):
+        todo = Todo("Foo due:2015-11-16")
+        self.assertEqual(todo.due_date(), date(2015, 11, 16))
+        todo.set_tag('due', '2015-11-17')
+        self.assertEqual(todo.due_date(), date(2015, 11, 17))
+
+    def test_date_cache2(self):
+        todo = Todo("Foo t:2015-11-16")
+        self.assertEqual(todo.start_date(), date(2015, 11, 16))
+        todo.remove_tag('t')
+        self.assertIsNone(todo.start_date())
+
+    def test_date_cache3(self):
+        todo = Todo("Foo due:2015-11-16")
+        self.assertEqual(todo.due_date(), date(2015, 11, 16))
+        todo.set_source_text("Foo due:2015-11-18")
+        self.assertEqual(todo.due_date(), date(2015, 11, 18))
+
 if __name__ == '__main__':
     unittest.main()
@@ -350,5 +350,24 @@ class TodoBaseTester(TopydoTest):
         self.assertEqual(todo.creation_date(), creation_date)
         self.assertEqual(todo.src, "x 2014-07-25 2014-07-24 Foo")
 
+    def test_fields(self):
+        todo = TodoBase("(C) 2014-07-23 Foo +Project @Context due:2014-07-24")
+
+        self.assertEqual(todo.fields, {
+            'completed': False,
+            'completionDate': None,
+            'priority': 'C',
+            'creationDate': date(2014, 7, 23),
+            'text': 'Foo +Project @Context',
+            'projects': ['Project'],
+            'contexts': ['Context'],
+            'tags': {'due': ['2014-07-24']},
+        })
+
+    def test_slots(self):
+        todo = TodoBase("Foo")
+
+        self.assertFalse(hasattr(todo, '__dict__'))
+
 if __name__ == '__main__':
     unittest.main()
@@ -14,10 +14,22 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from test.facilities import load_file
 from test.topydo_testcase import TopydoTest
+from topydo.lib.Config import config
+from topydo.lib.TodoFile import TodoFile
+
+# We're searching for 'mock'
+# pylint: disable=no-name-in-module
+try:
+    from unittest import mock
+except ImportError:
+    import mock
 
 
 class TodoFileTest(TopydoTest):
@@ -32,5 +44,177 @@ class TodoFileTest(TopydoTest):
         self.assertEqual(todofile[0].source(),
                          u'(C) \u25ba UTF-8 test \u25c4')
 
+
+class TodoFileAppendTest(TopydoTest):
+    def setUp(self):
+        super().setUp()
+
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        self.todofile = TodoFile(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+        super().tearDown()
+
+    def _contents(self):
+        with open(self.path, 'rb') as todofile:
+            return todofile.read().decode('utf-8')
+
+    def test_append_empty(self):
+        self.todofile.append("x 2015-11-16 Foo")
+
+        self.assertEqual(self._contents(), "x 2015-11-16 Foo\n")
+
+    def test_append(self):
+        self.todofile.write("x 2015-11-15 Foo")
+        self.todofile.append("x 2015-11-16 Bar\nx 2015-11-16 \u25ba")
+
+        self.assertEqual(self._contents(),
+                         "x 2015-11-15 Foo\nx 2015-11-16 Bar\n"
+                         "x 2015-11-16 \u25ba\n")
+
+    def test_append_no_newline(self):
+        """ A missing newline at the end of the file is added first. """
+        with open(self.path, 'w') as todofile:
+            todofile.write("x 2015-11-15 Foo")
+
+        self.todofile.append("x 2015-11-16 Bar")
+
+        self.assertEqual(self._contents(),
+                         "x 2015-11-15 Foo\nx 2015-11-16 Bar\n")
+
+    def test_append_blank(self):
+        """ A file with only whitespace is overwritten. """
+        self.todofile.write("")
+        self.todofile.append("x 2015-11-16 Foo")
+
+        self.assertEqual(self._contents(), "x 2015-11-16 Foo\n")
+
+    def test_append_blank_lines(self):
+        """ Blank lines at the end of a file with todo items are kept. """
+        with open(self.path, 'w') as todofile:
+            todofile.write("x 2015-11-15 Foo\n\n")
+
+        self.todofile.append("x 2015-11-16 Bar")
+
+        self.assertEqual(self._contents(),
+                         "x 2015-11-15 Foo\n\nx 2015-11-16 Bar\n")
+
+
+class TodoFileWriteTest(TopydoTest):
+    def setUp(self):
+        super().setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'todo.txt')
+        self.todofile = TodoFile(self.path)
+
+        with open(self.path, 'w') as todofile:
+            todofile.write("Old\n")
+
+        self.inode = os.stat(self.path).st_ino
+
+    def tearDown(self):
+        os.chmod(self.directory, 0o700)
+        shutil.rmtree(self.directory)
+        super().tearDown()
+
+    def _contents(self):
+        with open(self.path, 'rb') as todofile:
+            return todofile.read().decode('utf-8')
+
+    def _replaced(self):
+        """ Returns True when the file was replaced by a new one. """
+        return os.stat(self.path).st_ino != self.inode
+
+    def _leftovers(self):
+        """ Returns the files next to todo.txt, such as temporary files. """
+        return [f for f in os.listdir(self.directory) if f != 'todo.txt']
+
+    def test_write_atomic(self):
+        config(p_overrides={('topydo', 'atomic_write'): '1'})
+        os.chmod(self.path, 0o640)
+
+        self.todofile.write("Foo\n\u25ba Bar")
+
+        self.assertEqual(self._contents(), "Foo\n\u25ba Bar\n")
+        self.assertTrue(self._replaced())
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o640)
+        self.assertEqual(self._leftovers(), [])
+
+    def test_write_atomic_new_file(self):
+        config(p_overrides={('topydo', 'atomic_write'): '1'})
+        os.remove(self.path)
+
+        self.todofile.write("Foo")
+
+        self.assertEqual(self._contents(), "Foo\n")
+        self.assertEqual(self._leftovers(), [])
+
+    def test_write_atomic_symlink(self):
+        """ The file behind a symbolic link is replaced, not the link. """
+        config(p_overrides={('topydo', 'atomic_write'): '1'})
+        link = os.path.join(self.directory, 'link.txt')
+        os.symlink(self.path, link)
+
+        TodoFile(link).write("Foo")
+
+        self.assertTrue(os.path.islink(link))
+        self.assertEqual(self._contents(), "Foo\n")
+
+    def test_write_atomic_hard_link(self):
+        """ A file with hard links is overwritten in place. """
+        config(p_overrides={('topydo', 'atomic_write'): '1'})
+        link = os.path.join(self.directory, 'link.txt')
+        os.link(self.path, link)
+
+        self.todofile.write("Foo")
+
+        self.assertFalse(self._replaced())
+        with open(link) as linked:
+            self.assertEqual(linked.read(), "Foo\n")
+
+    def test_write_disabled(self):
+        config(p_overrides={('topydo', 'atomic_write'): '0'})
+
+        self.todofile.write("Foo\n\u25ba Bar")
+
+        self.assertEqual(self._contents(), "Foo\n\u25ba Bar\n")
+        self.assertFalse(self._replaced())
+
+    @unittest.skipIf(not hasattr(os, 'geteuid') or os.geteuid() == 0,
+                     "Directory permissions don't apply")
+    def test_write_read_only_directory(self):
+        """ Without a writable directory, the file is written in place. """
+        config(p_overrides={('topydo', 'atomic_write'): '1'})
+        os.chmod(self.directory, 0o500)
+
+        self.todofile.write("Foo")
+
+        self.assertEqual(self._contents(), "Foo\n")
+        self.assertFalse(self._replaced())
+
+    @mock.patch('tempfile.mkstemp', side_effect=PermissionError)
+    def test_write_no_temp_file(self, _):
+        """ When no temporary file can be created, write in place. """
+        config(p_overrides={('topydo', 'atomic_write'): '1'})
+
+        self.todofile.write("Foo")
+
+        self.assertEqual(self._contents(), "Foo\n")
+        self.assertFalse(self._replaced())
+
+    @mock.patch('os.replace', side_effect=PermissionError)
+    def test_write_no_rename(self, _):
+        """ When the file can't be replaced, write in place. """
+        config(p_overrides={('topydo', 'atomic_write'): '1'})
+
+        self.todofile.write("Foo")
+
+        self.assertEqual(self._contents(), "Foo\n")
+        self.assertFalse(self._replaced())
+        self.assertEqual(self._leftovers(), [])
+
 if __name__ == '__main__':
     unittest.main()
@@ -104,6 +104,26 @@ class TodoListTester(TopydoTest):
         self.assertTrue(self.todolist.is_dirty())
         self.assertRaises(InvalidTodoException, self.todolist.number, todo)
 
+    def test_delete_renumber(self):
+        """ Line numbers after a deleted item shift, those before don't. """
+        todo1 = self.todolist.todo(1)
+        todo4 = self.todolist.todo(4)
+        todo5 = self.todolist.todo(5)
+
+        self.todolist.delete(self.todolist.todo(3))
+        self.todolist.delete(self.todolist.todo(2))
+        todo6 = self.todolist.add("New item")
+
+        self.assertEqual(self.todolist.number(todo1), 1)
+        self.assertEqual(self.todolist.number(todo4), 2)
+        self.assertEqual(self.todolist.number(todo5), 3)
+        self.assertEqual(self.todolist.number(todo6), 4)
+
+        self.todolist.delete(todo4)
+
+        self.assertEqual(self.todolist.number(todo6), 3)
+        self.assertEqual(self.todolist.todo(3), todo6)
+
     def test_delete2(self):
         """ Try to remove a todo item that does not exist. """
         count = self.todolist.count()
@@ -114,6 +134,65 @@ class TodoListTester(TopydoTest):
         self.assertEqual(self.todolist.count(), count)
         self.assertFalse(self.todolist.is_dirty())
 
+    def test_delete_many1(self):
+        todo1 = self.todolist.todo(1)
+        todo2 = self.todolist.todo(2)
+        todo4 = self.todolist.todo(4)
+        todo5 = self.todolist.todo(5)
+        count = self.todolist.count()
+
+        self.todolist.delete_many([todo4, todo2, Todo('Not in the list')])
+
+        self.assertEqual(self.todolist.count(), count - 2)
+        self.assertTrue(self.todolist.is_dirty())
+        self.assertEqual(self.todolist.number(todo1), 1)
+        self.assertEqual(self.todolist.number(todo5), 3)
+        self.assertRaises(InvalidTodoException, self.todolist.number, todo2)
+        self.assertRaises(InvalidTodoException, self.todolist.number, todo4)
+
+    def test_delete_many2(self):
+        """ Try to remove todo items that do not exist. """
+        count = self.todolist.count()
+
+        self.todolist.delete_many([Todo('Not in the list')])
+
+        self.assertEqual(self.todolist.count(), count)
+        self.assertFalse(self.todolist.is_dirty())
+
+    def test_appended_todos1(self):
+        self.assertEqual(self.todolist.appended_todos(), [])
+
+        todo = self.todolist.add("New item")
+
+        self.assertEqual(self.todolist.appended_todos(), [todo])
+
+    def test_appended_todos2(self):
+        """ Modifying a saved todo item requires a full write. """
+        self.todolist.add("New item")
+        self.todolist.set_priority(self.todolist.todo(1), 'A')
+
+        self.assertIsNone(self.todolist.appended_todos())
+
+    def test_appended_todos3(self):
+        """ Removing a saved todo item requires a full write. """
+        self.todolist.delete(self.todolist.todo(2))
+
+        self.assertIsNone(self.todolist.appended_todos())
+
+    def test_appended_todos4(self):
+        """ Removing a new todo item leaves nothing to append. """
+        todo = self.todolist.add("New item")
+        self.todolist.delete(todo)
+
+        self.assertEqual(self.todolist.appended_todos(), [])
+
+    def test_mark_saved(self):
+        self.todolist.set_priority(self.todolist.todo(1), 'A')
+        self.todolist.mark_saved()
+
+        self.assertFalse(self.todolist.is_dirty())
+        self.assertEqual(self.todolist.appended_todos(), [])
+
     def test_append1(self):
         todo = self.todolist.todo(3)
         self.todolist.append(todo, "@Context3")
@@ -234,6 +313,55 @@ class TodoListTester(TopydoTest):
 
         self.assertNotEqual(self.todolist.number(todo), 't5c')
 
+    def test_uid_stable_after_add(self):
+        """ Adding an item leaves the other identifiers alone. """
+        config("test/data/todolist-uid.conf")
+        uids = [self.todolist.number(todo) for todo in self.todolist]
+
+        todo = self.todolist.add("(C) Foo")
+
+        self.assertEqual(uids, [self.todolist.number(t) for t in
+                                self.todolist.todos()[:-1]])
+        self.assertNotIn(self.todolist.number(todo), uids)
+        self.assertEqual(self.todolist.todo(self.todolist.number(todo)), todo)
+
+    def test_uid_stable_after_delete(self):
+        """ Deleting an item leaves the other identifiers alone. """
+        config("test/data/todolist-uid.conf")
+        todo = self.todolist.todo('t5c')
+        uids = [self.todolist.number(t) for t in self.todolist.todos()[1:]]
+
+        self.todolist.delete(todo)
+
+        self.assertEqual(uids, [self.todolist.number(t) for t in
+                                self.todolist])
+        self.assertRaises(InvalidTodoException, self.todolist.todo, 't5c')
+
+    def test_uid_collision(self):
+        """ Items with the same text obtain different identifiers. """
+        config("test/data/todolist-uid.conf")
+        todo1 = self.todolist.add("Same text")
+        todo2 = self.todolist.add("Same text")
+
+        self.assertNotEqual(self.todolist.number(todo1),
+                            self.todolist.number(todo2))
+
+        # the slot of the first item is handed out again after deletion
+        uid = self.todolist.number(todo1)
+        self.todolist.delete(todo1)
+        todo3 = self.todolist.add("Same text")
+
+        self.assertEqual(self.todolist.number(todo3), uid)
+
+    def test_uid_key_size(self):
+        """ Identifiers get longer when the list grows beyond a threshold. """
+        config("test/data/todolist-uid.conf")
+        todos = self.todolist.add_list(["Item {}".format(i)
+                                        for i in range(500)])
+
+        self.assertEqual(len(self.todolist.number(todos[0])), 4)
+        self.assertEqual(len(self.todolist.number(self.todolist.todos()[0])), 4)
+
     def test_iteration(self):
         """ Confirms that the iternation method is working. """
         results = ["(C) Foo @Context2 Not@Context +Project1 Not+Project",
@@ -415,6 +543,200 @@ class TodoListDependencyTester(TopydoTest):
         self.assertTrue(self.todolist.dirty)
         self.assertTrue(self.todolist.todo_by_dep_id('99'))
 
+    def test_closure_after_add_dep(self):
+        """ Cached children and parents are updated for a new dependency. """
+        todo1 = self.todolist.todo(1)
+        todo4 = self.todolist.todo(4)
+        todo5 = self.todolist.todo(5)
+        self.todolist.children(todo1)
+        self.todolist.parents(todo5)
+
+        self.todolist.add_dependency(todo4, todo5)
+
+        self.assertIn(todo5, self.todolist.children(todo1))
+        self.assertEqual(sorted([t.source() for t in
+                                 self.todolist.parents(todo5)]),
+                         ['Baz p:1 id:2', 'Buzz p:2 id:5', 'Foo id:1'])
+
+    def test_closure_after_remove_dep(self):
+        """ Cached children and parents are updated after a removal. """
+        todo1 = self.todolist.todo(1)
+        todo3 = self.todolist.todo(3)
+        todo4 = self.todolist.todo(4)
+        self.todolist.children(todo1)
+        self.todolist.parents(todo4)
+
+        self.todolist.remove_dependency(todo3, todo4)
+
+        self.assertNotIn(todo4, self.todolist.children(todo1))
+        self.assertEqual(self.todolist.parents(todo4), [])
+
+    def test_closure_after_delete(self):
+        """ A deleted todo disappears from the cached children. """
+        todo1 = self.todolist.todo(1)
+        todo3 = self.todolist.todo(3)
+        self.todolist.children(todo1)
+
+        self.todolist.delete(todo3)
+
+        self.assertEqual([t.source() for t in self.todolist.children(todo1)],
+                         ['Bar p:1'])
+
+    def test_closure_after_sort(self):
+        """ Dependencies survive replacing the contents of the list. """
+        todo1 = self.todolist.todo(1)
+        self.todolist.children(todo1)
+
+        self.todolist.replace(list(reversed(self.todolist.todos())))
+
+        self.assertEqual(len(self.todolist.children(todo1)), 3)
+
+    def test_parent_after_child(self):
+        """ A parent listed after its children is connected to them. """
+        todolist = TodoList(["Child1 p:1", "Child2 p:1", "Parent id:1"])
+
+        children = todolist.children(todolist.todo(3))
+        self.assertEqual(sorted([t.source() for t in children]),
+                         ['Child1 p:1', 'Child2 p:1'])
+
+    def test_append_dependency(self):
+        """ Appending a p tag connects the todo to its parent. """
+        todo = self.todolist.todo(5)
+        self.todolist.children(todo)
+
+        self.todolist.append(todo, "p:3")
+
+        children = self.todolist.children(self.todolist.todo(9))
+        self.assertEqual([t.source() for t in children], ['Fnord p:3'])
+
+    def test_append_id(self):
+        """ Appending an id tag connects the todo to orphaned children. """
+        todo = self.todolist.todo(5)
+        self.todolist.children(todo)
+
+        self.todolist.append(todo, "id:4")
+
+        children = self.todolist.children(todo)
+        self.assertEqual([t.source() for t in children], ['Orphan p:4'])
+        self.assertEqual(self.todolist.todo_by_dep_id('4'), todo)
+
+    def test_delete_orphan(self):
+        """ The id of a deleted orphan can be handed out again. """
+        self.todolist.delete(self.todolist.todo(10))
+
+        todo4 = self.todolist.todo(4)
+        todo5 = self.todolist.todo(5)
+        self.todolist.add_dependency(todo5, todo4)
+
+        self.assertTrue(todo5.has_tag('id', '4'))
+        self.assertEqual(self.todolist.todo_by_dep_id('4'), todo5)
+
+    def test_delete_many(self):
+        """ Dependencies of deleted todos are removed. """
+        todo1 = self.todolist.todo(1)
+        todo2 = self.todolist.todo(2)
+        todo3 = self.todolist.todo(3)
+        todo4 = self.todolist.todo(4)
+
+        self.todolist.delete_many([todo1, todo4, todo1])
+
+        self.assertEqual(self.todolist.count(), 8)
+        self.assertEqual(todo2.source(), "Bar")
+        self.assertEqual(todo3.source(), "Baz")
+        self.assertEqual(self.todolist.children(todo3), [])
+        self.assertEqual(self.todolist.parents(todo2), [])
+
+    def test_delete_duplicate_parent_tag(self):
+        """ A deleted todo with a duplicated p tag is no child anymore. """
+        todolist = TodoList(['Parent id:1', 'Child p:1 p:1', 'Sibling p:1'])
+        parent = todolist.todo(1)
+        child = todolist.todo(2)
+
+        todolist.children(parent)
+        todolist.delete(child)
+        todolist.append(parent, 'p:7')
+
+        self.assertEqual([t.source() for t in todolist.children(parent)],
+                         ['Sibling p:1'])
+
+    def test_delete_many_children(self):
+        """ A parent loses its id when all its children are deleted. """
+        todolist = TodoList(['Parent id:1', 'Child1 p:1', 'Child2 p:1',
+                             'Other p:1 id:2', 'Grandchild p:2'])
+        parent = todolist.todo(1)
+        children = [todolist.todo(2), todolist.todo(3), todolist.todo(4)]
+
+        todolist.delete_many(children[:2])
+
+        self.assertEqual(parent.source(), 'Parent id:1')
+        self.assertEqual([t.source() for t in children[:2]],
+                         ['Child1', 'Child2'])
+
+        todolist.delete_many(children[2:])
+
+        self.assertEqual(parent.source(), 'Parent')
+        self.assertEqual(todolist.todo(2).source(), 'Grandchild')
+        self.assertEqual(todolist.children(parent), [])
+        self.assertIsNone(todolist.todo_by_dep_id('1'))
+
+    def test_delete_many_duplicate_parent_tag(self):
+        todolist = TodoList(['Parent id:1', 'Child p:1 p:1', 'Sibling p:1'])
+        parent = todolist.todo(1)
+        child = todolist.todo(2)
+
+        todolist.children(parent)
+        todolist.delete_many([child])
+        todolist.append(parent, 'p:7')
+
+        self.assertEqual([t.source() for t in todolist.children(parent)],
+                         ['Sibling p:1'])
+
+    def test_delete_self_reference(self):
+        """ A deleted todo that refers to itself leaves no edges behind. """
+        todolist = TodoList(['Self id:1 p:1 p:1', 'Other p:1'])
+        todo = todolist.todo(1)
+        other = todolist.todo(2)
+
+        todolist.children(todo)
+        todolist.delete(todo)
+        new = todolist.add('New id:1 p:1')
+
+        self.assertEqual(other.source(), 'Other')
+        self.assertEqual(todolist.children(new), [new])
+        self.assertEqual(todolist.parents(other), [])
+
+    def test_add_dep_second_id(self):
+        """ A new dependency id is not taken by any id tag of a todo. """
+        todolist = TodoList(['A id:1 id:2', 'B', 'C', 'D p:1'])
+        todolist.add_dependency(todolist.todo(2), todolist.todo(3))
+
+        self.assertEqual(todolist.todo(2).source(), 'B id:3')
+        self.assertEqual(todolist.todo(3).source(), 'C p:3')
+
+    def test_add_dep_second_id_deleted(self):
+        """ The id tags of a deleted todo are available again. """
+        todolist = TodoList(['A id:1 id:2', 'B', 'C'])
+        todolist.children(todolist.todo(1))
+        todolist.delete(todolist.todo(1))
+        todolist.add_dependency(todolist.todo(1), todolist.todo(2))
+
+        self.assertEqual(todolist.todo(1).source(), 'B id:1')
+
+    def test_todo_parents(self):
+        """ A todo finds its parents through the list it belongs to. """
+        todo = self.todolist.todo(4)
+
+        self.assertEqual(sorted([t.source() for t in todo.parents()]),
+                         ['Baz p:1 id:2', 'Foo id:1'])
+
+    def test_todo_parents_deleted(self):
+        """ A deleted todo no longer refers to its former list. """
+        todo = self.todolist.todo(4)
+        self.todolist.delete(todo)
+
+        self.assertIsNone(todo.todolist)
+        self.assertEqual(todo.parents(), [])
+
 
 class TodoListCleanDependencyTester(TopydoTest):
     """
@@ -464,6 +786,18 @@ class TodoListCleanDependencyTester(TopydoTest):
         self.assertFalse(self.todolist.todo(1).has_tag('id'))
         self.assertFalse(self.todolist.todo_by_dep_id('1'))
 
+    def test_clean_dependencies4(self):
+        """ Clean all id: tags of a todo item without child todos. """
+        self.todolist.add("Foo id:1 id:2")
+        self.todolist.add("Bar")
+
+        self.todolist.clean_dependencies()
+        self.todolist.add("Baz")
+        self.todolist.clean_dependencies()
+
+        self.assertFalse(self.todolist.todo(1).has_tag('id'))
+        self.assertEqual(self.todolist.todo(1).source(), "Foo")
+
 
 if __name__ == '__main__':
     unittest.main()
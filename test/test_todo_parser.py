@@ -0,0 +1,156 @@
+# Topydo - A todo.txt client written in Python.
+# Copyright (C) 2014 - 2015 Bram Schoenmakers <me@bramschoenmakers.nl>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import random
+import re
+import unittest
+
+from test.topydo_testcase import TopydoTest
+from topydo.lib.TodoParser import parse_line
+from topydo.lib.Utils import date_string_to_date
+
+_DATE_MATCH = r'\d{4}-\d{2}-\d{2}'
+
+_COMPLETED_HEAD_MATCH = re.compile(
+    r'x ((?P<completionDate>' + _DATE_MATCH + ') )' + '((?P<creationDate>' +
+    _DATE_MATCH + ') )?(?P<rest>.*)')
+
+_NORMAL_HEAD_MATCH = re.compile(
+    r'(\((?P<priority>[A-Z])\) )?' + '((?P<creationDate>' + _DATE_MATCH +
+    ') )?(?P<rest>.*)')
+
+_TAG_MATCH = re.compile('(?P<tag>[^:]+):(?P<value>.+)')
+_PROJECT_MATCH = re.compile(r'\+(\S*\w)')
+_CONTEXT_MATCH = re.compile(r'@(\S*\w)')
+
+
+def reference_parse_line(p_string):
+    """
+    The original regular expression based implementation of parse_line,
+    which the current implementation should agree with.
+    """
+    result = {
+        'completed': False,
+        'completionDate': None,
+        'priority': None,
+        'creationDate': None,
+        'text': "",
+        'projects': [],
+        'contexts': [],
+        'tags': {},
+    }
+
+    completed_head = _COMPLETED_HEAD_MATCH.match(p_string)
+    normal_head = _NORMAL_HEAD_MATCH.match(p_string)
+
+    rest = p_string
+
+    if completed_head:
+        result['completed'] = True
+
+        completion_date = completed_head.group('completionDate')
+        result['completionDate'] = date_string_to_date(completion_date)
+
+        creation_date = completed_head.group('creationDate')
+        result['creationDate'] = date_string_to_date(creation_date)
+
+        rest = completed_head.group('rest')
+    elif normal_head:
+        result['priority'] = normal_head.group('priority')
+
+        creation_date = normal_head.group('creationDate')
+        result['creationDate'] = date_string_to_date(creation_date)
+
+        rest = normal_head.group('rest')
+
+    for word in rest.split():
+        project = _PROJECT_MATCH.match(word)
+        if project:
+            result['projects'].append(project.group(1))
+
+        context = _CONTEXT_MATCH.match(word)
+        if context:
+            result['contexts'].append(context.group(1))
+
+        tag = _TAG_MATCH.match(word)
+        if tag:
+            tag_name = tag.group('tag')
+            tag_value = tag.group('value')
+            try:
+                result['tags'][tag_name].append(tag_value)
+            except KeyError:
+                result['tags'][tag_name] = [tag_value]
+        else:
+            result['text'] += word + ' '
+
+    # strip trailing space from resulting text
+    result['text'] = result['text'][:-1]
+
+    return result
+
+
+def random_line(p_random):
+    """ Generates a todo item with many corner cases. """
+    heads = ['', 'x ', 'x 2015-11-06 ', 'x 2015-11-06 2015-11-01 ',
+             '(A) ', '(a) ', '(A)', '(A) 2015-11-01 ', '2015-11-01 ',
+             'x (A) 2015-11-01 ', 'X 2015-11-06 ', ' x 2015-11-06 ']
+    words = ['Foo', 'bar', '+Project', '+', '+:', '+a:b', '+proj.', '+é',
+             '@Context', '@', '@ctx!', '@a:b', '@@x', 'key:value', 'key:',
+             ':value', ':', 'a:b:c', 'due:2015-11-08', '::', 'é:ü', 'x',
+             '2015-11-01', '(B)', 'http://example.com', '50%', '+a+b']
+    separators = [' ', ' ', ' ', '  ', '\t', '\xa0', '\u3000', '\x1c']
+
+    line = p_random.choice(heads)
+
+    for _ in range(p_random.randint(0, 8)):
+        line += p_random.choice(words) + p_random.choice(separators)
+
+    return line
+
+
+class TodoParserTest(TopydoTest):
+    def test_parse1(self):
+        result = parse_line("x 2015-11-06 2015-11-01 Foo +Bar @Baz due:2015-11-08")
+
+        self.assertTrue(result['completed'])
+        self.assertEqual(result['completionDate'].isoformat(), '2015-11-06')
+        self.assertEqual(result['creationDate'].isoformat(), '2015-11-01')
+        self.assertEqual(result['text'], 'Foo +Bar @Baz')
+        self.assertEqual(result['projects'], ['Bar'])
+        self.assertEqual(result['contexts'], ['Baz'])
+        self.assertEqual(result['tags'], {'due': ['2015-11-08']})
+
+    def test_parse2(self):
+        result = parse_line("(C) +a:b @c: key:value1 key:value2")
+
+        self.assertEqual(result['priority'], 'C')
+        self.assertEqual(result['text'], '@c:')
+        self.assertEqual(result['projects'], ['a:b'])
+        self.assertEqual(result['contexts'], ['c'])
+        self.assertEqual(result['tags'], {'+a': ['b'],
+                                          'key': ['value1', 'value2']})
+
+    def test_parse_differential(self):
+        """ Compares the parser with the original implementation. """
+        rand = random.Random(1)
+
+        for _ in range(5000):
+            line = random_line(rand)
+            self.assertEqual(parse_line(line), reference_parse_line(line),
+                             repr(line))
+
+if __name__ == '__main__':
+    unittest.main()
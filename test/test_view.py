@@ -37,5 +37,30 @@ class ViewTest(TopydoTest):
 
         self.assertEqual(print_view(view), todolist_to_string(ref))
 
+    def test_view_limit(self):
+        """ A limited view shows the first items of the sorted view. """
+        todofile = TodoFile('test/data/FilterTest1.txt')
+        todolist = TodoList(todofile.read())
+        sorter = Sorter('desc:text')
+        todofilter = Filter.GrepFilter('+Project')
+
+        full_view = todolist.view(sorter, [todofilter])
+        view = todolist.view(sorter, [todofilter, Filter.LimitFilter(2)])
+
+        self.assertEqual(view.todos, full_view.todos[:2])
+
+    def test_view_filter_after_limit(self):
+        """ Filters after a limit filter operate on the limited list. """
+        todofile = TodoFile('test/data/FilterTest1.txt')
+        todolist = TodoList(todofile.read())
+        sorter = Sorter('text')
+        limit = Filter.LimitFilter(3)
+        todofilter = Filter.GrepFilter('+Project')
+
+        full_view = todolist.view(sorter, [])
+        view = todolist.view(sorter, [limit, todofilter])
+
+        self.assertEqual(view.todos, todofilter.filter(full_view.todos[:3]))
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,12 +16,15 @@
 
 import unittest
 
+from topydo.lib.Clock import clock
 from topydo.lib.Config import config
 
 
 class TopydoTest(unittest.TestCase):
     def tearDown(self):
         """
-        Make sure that every test case leaves a clean configuration.
+        Make sure that every test case leaves a clean configuration and a
+        clock that follows the system date.
         """
         config("")
+        clock(p_reset=True)
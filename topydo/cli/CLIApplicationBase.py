@@ -99,6 +99,7 @@ except ConfigError as config_error:
     error(str(config_error))
     sys.exit(1)
 
+from topydo.lib.Clock import clock
 from topydo.lib import TodoFile
 from topydo.lib import TodoList
 from topydo.lib import TodoListBase
@@ -162,12 +163,17 @@ class CLIApplicationBase(object):
 
         This means that all completed tasks are moved to the archive file
         (defaults to done.txt).
+
+        The archive file is only read when a backup is made, otherwise the
+        completed tasks are simply appended to it.
         """
         archive_file = TodoFile.TodoFile(config().archive())
-        archive = TodoListBase.TodoListBase(archive_file.read())
 
         if self.backup:
+            archive = TodoListBase.TodoListBase(archive_file.read())
             self.backup.add_archive(archive)
+        else:
+            archive = TodoListBase.TodoListBase([])
 
         if archive:
             from topydo.commands.ArchiveCommand import ArchiveCommand
@@ -175,7 +181,10 @@ class CLIApplicationBase(object):
             command.execute()
 
             if archive.is_dirty():
-                archive_file.write(archive.print_todos())
+                if self.backup:
+                    archive_file.write(archive.print_todos())
+                else:
+                    archive_file.append(archive.print_todos())
 
     def _help(self, args):
         if args is None:
@@ -194,6 +203,9 @@ class CLIApplicationBase(object):
         Execute a subcommand with arguments. p_command is a class (not an
         object).
         """
+        # take a fresh snapshot of today's date for this command
+        clock().tick()
+
         if config().backup_count() > 0 and p_command and not self.is_read_only(p_command):
             call = [p_command.__module__.lower()[16:-7]] + p_args # strip "topydo.commands" and "Command"
 
@@ -232,7 +244,17 @@ class CLIApplicationBase(object):
             if self.backup:
                 self.backup.save(self.todolist)
 
-            self.todofile.write(self.todolist.print_todos())
+            # when todo items were only added, there's no need to rewrite
+            # the whole file
+            appended = self.todolist.appended_todos()
+
+            if appended is None:
+                self.todofile.write(self.todolist.print_todos())
+            elif appended:
+                from topydo.lib.PrettyPrinter import PrettyPrinter
+                self.todofile.append(PrettyPrinter().print_list(appended))
+
+            self.todolist.mark_saved()
 
         self.backup = None
 
@@ -19,7 +19,6 @@
 import getopt
 import sys
 
-from topydo.cli.CLI import CLIApplication
 from topydo.cli.CLIApplicationBase import MAIN_OPTS, error
 
 # enable color on windows CMD
@@ -46,8 +45,10 @@ def main():
             except ImportError:
                 error("You have to install prompt-toolkit to run prompt mode.")
         else:
+            from topydo.cli.CLI import CLIApplication
             CLIApplication().run()
     except IndexError:
+        from topydo.cli.CLI import CLIApplication
         CLIApplication().run()
 
 if __name__ == '__main__':
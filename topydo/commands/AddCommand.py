@@ -18,10 +18,10 @@
 
 import codecs
 import re
-from datetime import date
 from os.path import expanduser
 from sys import stdin
 
+from topydo.lib.Clock import clock
 from topydo.lib.Command import Command
 from topydo.lib.Config import config
 from topydo.lib.prettyprinters.Numbers import PrettyPrinterNumbers
@@ -109,7 +109,7 @@ class AddCommand(Command):
             add_dependencies('after')
 
             if config().auto_creation_date():
-                p_todo.set_creation_date(date.today())
+                p_todo.set_creation_date(clock().today())
 
         todo_text = _preprocess_input_todo(p_todo_text)
         todo = self.todolist.add(todo_text)
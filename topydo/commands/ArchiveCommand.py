@@ -31,6 +31,8 @@ class ArchiveCommand(Command):
         self.archive = p_archive_list
 
     def execute(self):
-        for todo in [t for t in self.todolist.todos() if t.is_completed()]:
-            self.archive.add_todo(todo)
-            self.todolist.delete(todo)
+        completed = [t for t in self.todolist.todos() if t.is_completed()]
+
+        if completed:
+            self.archive.add_todos(completed)
+            self.todolist.delete_many(completed)
@@ -25,6 +25,10 @@ class DeleteCommand(DCommand):
         super().__init__(
             p_args, p_todolist, p_out, p_err, p_prompt)
 
+        # todos are removed from the list at once, after processing all of
+        # them
+        self.deleted = []
+
     def prompt_text(self):
         return "Also remove subtasks? [y/N] "
 
@@ -32,7 +36,13 @@ class DeleteCommand(DCommand):
         return "Removed: "
 
     def execute_specific_core(self, p_todo):
-        self.todolist.delete(p_todo)
+        # dependencies are removed right away, such that the remaining todos
+        # are processed as if p_todo was gone already
+        self.todolist.remove_dependencies(p_todo)
+        self.deleted.append(p_todo)
+
+    def execute_all_specific(self):
+        self.todolist.delete_many(self.deleted)
 
     def execute_specific(self, p_todo):
         self.out(self.prefix() + self.printer.print_todo(p_todo))
@@ -14,8 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from datetime import date
-
+from topydo.lib.Clock import clock
 from topydo.lib.DCommand import DCommand
 from topydo.lib.PrettyPrinter import PrettyPrinter
 from topydo.lib.prettyprinters.Numbers import PrettyPrinterNumbers
@@ -31,7 +30,7 @@ class DoCommand(DCommand):
                  p_prompt=lambda a: None):
 
         self.strict_recurrence = False
-        self.completion_date = date.today()
+        self.completion_date = clock().today()
 
         super().__init__(
             p_args, p_todolist, p_out, p_err, p_prompt)
@@ -54,7 +53,7 @@ class DoCommand(DCommand):
                 if not self.completion_date:
                     self.completion_date = date_string_to_date(p_value)
             except ValueError:
-                self.completion_date = date.today()
+                self.completion_date = clock().today()
 
     def _handle_recurrence(self, p_todo):
         if p_todo.has_tag('rec'):
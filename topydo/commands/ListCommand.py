@@ -22,6 +22,9 @@ from topydo.lib.prettyprinters.Format import PrettyPrinterFormatFilter
 from topydo.lib.TodoListBase import InvalidTodoException
 from topydo.lib.Utils import get_terminal_size
 
+# narrower output lines leave no room for the truncated text
+MIN_WIDTH = 40
+
 
 class ListCommand(ExpressionCommand):
     def __init__(self, p_args, p_todolist, #pragma: no branch
@@ -36,6 +39,7 @@ class ListCommand(ExpressionCommand):
         self.show_all = False
         self.ids = None
         self.format = config().list_format()
+        self.width = None
 
     def _poke_icalendar(self):
         """
@@ -51,7 +55,7 @@ class ListCommand(ExpressionCommand):
         return True
 
     def _process_flags(self):
-        opts, args = self.getopt('f:F:i:n:Ns:x')
+        opts, args = self.getopt('f:F:i:n:Ns:w:x')
 
         for opt, value in opts:
             if opt == '-x':
@@ -79,6 +83,14 @@ class ListCommand(ExpressionCommand):
                     self.limit = int(value)
                 except ValueError:
                     pass  # use default value in configuration
+            elif opt == '-w':
+                try:
+                    width = int(value)
+
+                    if width >= MIN_WIDTH:
+                        self.width = width
+                except ValueError:
+                    pass  # use the width of the terminal
             elif opt == '-i':
                 self.ids = value.split(',')
 
@@ -124,7 +136,8 @@ class ListCommand(ExpressionCommand):
             final_format = ' ' * indent + self.format
 
             filters = []
-            filters.append(PrettyPrinterFormatFilter(self.todolist, final_format))
+            filters.append(PrettyPrinterFormatFilter(
+                self.todolist, final_format, self.width))
 
             self.printer = pretty_printer_factory(self.todolist, filters)
 
@@ -146,7 +159,8 @@ class ListCommand(ExpressionCommand):
 
     def usage(self):
         return """Synopsis: ls [-x] [-s <sort_expression>] [-f <output format>]
-[-F <format string>] [-i <item numbers>] [-N | -n <integer>] [expression]"""
+[-F <format string>] [-i <item numbers>] [-N | -n <integer>] [-w <width>]
+[expression]"""
 
     def help(self):
         return """\
@@ -202,5 +216,7 @@ When an expression is given, only the todos matching that expression are shown.
 -N : Limit number of items displayed such that they fit on the terminal.
 -s : Sort the list according to a sort expression. Defaults to the expression
      in the configuration.
+-w : Width of the output lines (at least 40), used to truncate %S and to align
+     text right of a tab. Defaults to the width of the terminal.
 -x : Show all todos (i.e. do not filter on dependencies or relevance).
 """
@@ -20,7 +20,6 @@ import json
 import time
 import zlib
 
-from copy import deepcopy
 from hashlib import sha1
 from os import path
 
@@ -40,12 +39,22 @@ def get_backup_path():
 
     return path.join(dirname, filename)
 
+def copy_todolist(p_todolist):
+    """
+    Returns a copy of the given todo list. The copy is created from the
+    source texts of the todo items, which are only parsed when needed.
+    """
+    if p_todolist is None:
+        return None
+
+    return TodoList([todo.source() for todo in p_todolist.todos()])
+
 class ChangeSet(object):
     """ Class for operations related with backup management. """
 
     def __init__(self, p_todolist=None, p_archive=None, p_call=[]):
-        self.todolist = deepcopy(p_todolist)
-        self.archive = deepcopy(p_archive)
+        self.todolist = copy_todolist(p_todolist)
+        self.archive = copy_todolist(p_archive)
         self.timestamp = str(int(time.time()))
         self.call = ' '.join(p_call)
 
@@ -81,12 +90,12 @@ class ChangeSet(object):
         self.json_file.write(dump_c)
 
     def add_archive(self, p_archive):
-        """ Sets deep copy of p_archive as archive attribute. """
-        self.archive = deepcopy(p_archive)
+        """ Sets a copy of p_archive as archive attribute. """
+        self.archive = copy_todolist(p_archive)
 
     def add_todolist(self, p_todolist):
-        """ Sets deep copy of p_todolist as todolist attribute. """
-        self.todolist = deepcopy(p_todolist)
+        """ Sets a copy of p_todolist as todolist attribute. """
+        self.todolist = copy_todolist(p_todolist)
 
     def save(self, p_todolist):
         """
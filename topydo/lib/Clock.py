@@ -0,0 +1,66 @@
+# Topydo - A todo.txt client written in Python.
+# Copyright (C) 2014 - 2015 Bram Schoenmakers <me@bramschoenmakers.nl>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Provides the date that counts as 'today' while executing a command.
+
+Filters, sorters and formatters consult this clock instead of asking the
+system for the current date for every todo item. The date is taken once per
+command, so all items are judged against the same day, also when a command
+happens to run across midnight.
+"""
+
+from datetime import date
+
+
+class _Clock(object):
+    def __init__(self, p_today=None):
+        """
+        Initializes the clock. When p_today is given, the clock always
+        returns that date instead of the system date.
+        """
+        self._fixed_today = p_today
+        self._today = p_today
+
+    def today(self):
+        """ Returns today's date, as determined at the start of the command. """
+        if self._today is None:
+            self._today = date.today()
+
+        return self._today
+
+    def tick(self):
+        """
+        Forgets the current date, such that the next call to today() consults
+        the system date again. Has no effect on a clock with a fixed date.
+        """
+        self._today = self._fixed_today
+
+
+def clock(p_today=None, p_reset=False):
+    """
+    Retrieve the clock instance.
+
+    When a date is given, the instance is replaced by one that always returns
+    that date (for testability). With p_reset, the instance is replaced by one
+    that follows the system date again.
+    """
+    if not clock.instance or p_today is not None or p_reset:
+        clock.instance = _Clock(p_today)
+
+    return clock.instance
+
+clock.instance = None
@@ -59,6 +59,7 @@ class _Config:
                 'archive_filename': 'done.txt',
                 'identifiers': 'linenumber',
                 'backup_count': '5',
+                'atomic_write': '1',
             },
 
             'add': {
@@ -174,6 +175,12 @@ class _Config:
         except ValueError:
             return int(self.defaults['topydo']['backup_count'])
 
+    def atomic_write(self):
+        try:
+            return self.cp.getboolean('topydo', 'atomic_write')
+        except ValueError:
+            return self.defaults['topydo']['atomic_write'] == '1'
+
     def list_limit(self):
         try:
             return self.cp.getint('ls', 'list_limit')
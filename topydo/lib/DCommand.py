@@ -47,6 +47,10 @@ class DCommand(MultiCommand):
             self.force = True
 
     def _uncompleted_children(self, p_todo):
+        if not p_todo.has_tag('id'):
+            # only todos with an id can have children
+            return []
+
         return sorted(
             [t for t in self.todolist.children(p_todo) if not t.is_completed()],
             key=self.todolist.number
@@ -77,15 +81,35 @@ class DCommand(MultiCommand):
                     self.out(self.prefix() + self.printer.print_todo(child))
 
     def _print_unlocked_todos(self, p_old, p_new):
-        delta = [todo for todo in p_new if todo not in p_old]
+        old = set(p_old)
+        delta = [todo for todo in p_new if todo not in old]
         if delta:
             self.out("The following todo item(s) became active:")
             self._print_list(delta)
 
-    def _active_todos(self):
+    def _unlock_candidates(self):
+        """
+        Returns the set of todos that could become active by this command.
+
+        Only the parents of the given todos, or of their subtodos, can be
+        unlocked. Todos without id or p tags have no relatives at all, so for
+        those the dependency information isn't needed.
         """
-        Returns a list of active todos, taking uncompleted subtodos into
-        account.
+        todos = [todo for todo in self.todos if todo and
+                 (todo.has_tag('id') or todo.has_tag('p'))]
+
+        if not todos:
+            return set()
+
+        children = [child for todo in todos
+                    for child in self.todolist.children(todo)]
+
+        return self.todolist.parents_of_any(todos + children)
+
+    def _active_todos(self, p_candidates):
+        """
+        Returns a list of active todos among the candidates, taking uncompleted
+        subtodos into account.
 
         The stored length of the todolist is taken into account, to prevent new
         todos created by recurrence to pop up as newly activated tasks.
@@ -93,7 +117,8 @@ class DCommand(MultiCommand):
         just before that point.
         """
         return [todo for todo in self.todolist.todos()[:self.length]
-                if not self._uncompleted_children(todo) and todo.is_active()]
+                if todo in p_candidates and
+                not self._uncompleted_children(todo) and todo.is_active()]
 
     def condition(self, _):
         """
@@ -114,8 +139,16 @@ class DCommand(MultiCommand):
         """
         raise NotImplementedError
 
+    def execute_all_specific(self):
+        """
+        Called once all todos have been processed, for operations that are
+        performed on all of them at once.
+        """
+        pass
+
     def _execute_multi_specific(self):
-        old_active = self._active_todos()
+        candidates = self._unlock_candidates()
+        old_active = self._active_todos(candidates)
 
         for todo in self.todos:
             if todo and self.condition(todo):
@@ -124,5 +157,6 @@ class DCommand(MultiCommand):
             else:
                 self.error(self.condition_failed_text())
 
-        current_active = self._active_todos()
+        self.execute_all_specific()
+        current_active = self._active_todos(candidates)
         self._print_unlocked_todos(old_active, current_active)
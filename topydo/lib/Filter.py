@@ -120,6 +120,18 @@ class DependencyFilter(Filter):
         super().__init__()
         self.todolist = p_todolist
 
+    def filter(self, p_todos):
+        """
+        Returns the todos without uncompleted children.
+
+        Instead of collecting the children of each todo, all todos that depend
+        on an uncompleted todo are looked up at once.
+        """
+        uncompleted = [t for t in self.todolist.todos() if not t.is_completed()]
+        blocked = self.todolist.parents_of_any(uncompleted)
+
+        return [t for t in p_todos if t not in blocked]
+
     def match(self, p_todo):
         """
         Returns True when there are no children that are uncompleted yet.
@@ -21,16 +21,23 @@ class DirectedGraph(object):
     """
     Represents a simple directed graph, used for tracking todo
     dependencies. The nodes are very simple: just integers.
+
+    Both the outgoing and incoming edges of each node are stored, such that
+    parents and children of a node can be found without visiting the whole
+    graph.
     """
 
     def __init__(self):
         self._edges = {}
+        self._reverse_edges = {}
         self._edge_numbers = {}
+        self._edge_id_count = {}
 
     def add_node(self, p_id):
         """ Adds a node to the graph. """
         if not self.has_node(p_id):
             self._edges[p_id] = set()
+            self._reverse_edges[p_id] = set()
 
     def has_node(self, p_id):
         """ Returns true iff the graph has the given node. """
@@ -50,7 +57,9 @@ class DirectedGraph(object):
                 self.add_node(p_to)
 
             self._edges[p_from].add(p_to)
+            self._reverse_edges[p_to].add(p_from)
             self._edge_numbers[(p_from, p_to)] = p_id
+            self._edge_id_count[p_id] = self._edge_id_count.get(p_id, 0) + 1
 
     def has_path(self, p_from, p_to):
         """
@@ -70,67 +79,86 @@ class DirectedGraph(object):
         """
         return self.reachable_nodes(p_id, p_recursive)
 
-    def reachable_nodes(self, p_id, p_recursive=True, p_reverse=False):
+    def reachable_nodes(self, p_id, p_recursive=True, p_reverse=False,
+                        p_known=None):
         """
         Returns the set of all neighbors that the given node can reach.
 
         If recursive, it will also return the neighbor's neighbors, etc.
         If reverse, the arrows are reversed and then the reachable neighbors
         are located.
+
+        p_known may map nodes to the set of nodes they can reach (in the same
+        direction), as obtained earlier from this function. The traversal does
+        not descend into those nodes but takes over their set instead.
         """
-        stack = [p_id]
-        visited = set()
-        result = set()
+        edges = self._reverse_edges if p_reverse else self._edges
+        p_known = p_known or {}
 
-        while len(stack):
-            current = stack.pop()
+        if p_id not in edges:
+            return set()
 
-            if current in visited or current not in self._edges:
-                continue
+        if not p_recursive:
+            return set(edges[p_id])
 
-            visited.add(current)
+        return self._traverse([p_id], edges, p_known)
 
-            if p_reverse:
-                parents = [node for node, neighbors in self._edges.items()
-                           if current in neighbors]
+    def reachable_nodes_reverse(self, p_id, p_recursive=True):
+        """ Find neighbors in the inverse graph. """
+        return self.reachable_nodes(p_id, p_recursive, True)
 
-                stack = stack + parents
-                result = result.union(parents)
-            else:
-                stack = stack + list(self._edges[current])
-                result = result.union(self._edges[current])
+    def reachable_from_any(self, p_ids, p_reverse=False):
+        """
+        Returns the set of all nodes that can be reached from at least one of
+        the given nodes, by following one or more edges. Nodes that are not in
+        the graph are ignored.
+        """
+        edges = self._reverse_edges if p_reverse else self._edges
+        return self._traverse([i for i in p_ids if i in edges], edges, {})
 
-            if not p_recursive:
-                break
+    @staticmethod
+    def _traverse(p_stack, p_edges, p_known):
+        """
+        Returns all nodes reachable from the nodes on p_stack, see
+        reachable_nodes for the meaning of p_known.
+        """
+        result = set()
 
-        return result
+        while p_stack:
+            for neighbor in p_edges[p_stack.pop()]:
+                if neighbor not in result:
+                    result.add(neighbor)
 
-    def reachable_nodes_reverse(self, p_id, p_recursive=True):
-        """ Find neighbors in the inverse graph. """
-        return self.reachable_nodes(p_id, p_recursive, True)
+                    if neighbor in p_known:
+                        result |= p_known[neighbor]
+                    else:
+                        p_stack.append(neighbor)
+
+        return result
 
     def remove_node(self, p_id, remove_unconnected_nodes=True):
         """ Removes a node from the graph. """
         if self.has_node(p_id):
-            for neighbor in self.incoming_neighbors(p_id):
-                self._edges[neighbor].remove(p_id)
+            for neighbor in list(self._reverse_edges[p_id]):
+                self._remove_edge_administration(neighbor, p_id)
 
-            neighbors = set()
-            if remove_unconnected_nodes:
-                neighbors = self.outgoing_neighbors(p_id)
+            neighbors = list(self._edges[p_id])
+            for neighbor in neighbors:
+                self._remove_edge_administration(p_id, neighbor)
 
             del self._edges[p_id]
+            del self._reverse_edges[p_id]
 
-            for neighbor in neighbors:
-                if self.is_isolated(neighbor):
-                    self.remove_node(neighbor)
+            if remove_unconnected_nodes:
+                for neighbor in neighbors:
+                    if self.is_isolated(neighbor):
+                        self.remove_node(neighbor)
 
     def is_isolated(self, p_id):
         """
         Returns True iff the given node has no incoming or outgoing edges.
         """
-        return(len(self.incoming_neighbors(p_id)) == 0
-               and len(self.outgoing_neighbors(p_id)) == 0)
+        return not self._edges.get(p_id) and not self._reverse_edges.get(p_id)
 
     def has_edge(self, p_from, p_to):
         """ Returns True when the graph has the given edge. """
@@ -140,7 +168,7 @@ class DirectedGraph(object):
         """
         Returns True if the client registered an edge with the given id.
         """
-        return p_id in self._edge_numbers.values()
+        return p_id in self._edge_id_count
 
     def edge_id(self, p_from, p_to):
         """
@@ -153,6 +181,20 @@ class DirectedGraph(object):
         except KeyError:
             return None
 
+    def _remove_edge_administration(self, p_from, p_to):
+        """
+        Removes the given (existing) edge from the adjacency sets and the edge
+        id bookkeeping.
+        """
+        self._edges[p_from].remove(p_to)
+        self._reverse_edges[p_to].remove(p_from)
+
+        edge_id = self._edge_numbers.pop((p_from, p_to))
+        self._edge_id_count[edge_id] -= 1
+
+        if not self._edge_id_count[edge_id]:
+            del self._edge_id_count[edge_id]
+
     def remove_edge(self, p_from, p_to, p_remove_unconnected_nodes=True):
         """
         Removes an edge from the graph.
@@ -160,13 +202,10 @@ class DirectedGraph(object):
         When remove_unconnected_nodes is True, then the nodes are also removed
         if they become isolated.
         """
-        if self.has_edge(p_from, p_to):
-            self._edges[p_from].remove(p_to)
+        if not self.has_edge(p_from, p_to):
+            return
 
-        try:
-            del self._edge_numbers[(p_from, p_to)]
-        except KeyError:
-            return None
+        self._remove_edge_administration(p_from, p_to)
 
         if p_remove_unconnected_nodes:
             if self.is_isolated(p_from):
@@ -175,20 +214,153 @@ class DirectedGraph(object):
             if self.is_isolated(p_to):
                 self.remove_node(p_to)
 
+    def _strongly_connected_components(self):
+        """
+        Returns the strongly connected components of the graph as a list of
+        lists of nodes, using Tarjan's algorithm.
+
+        The components are returned in reverse topological order: a component
+        is listed after all components it has edges to.
+        """
+        index = {}
+        lowlink = {}
+        stack = []
+        on_stack = set()
+        result = []
+
+        def visit(p_node):
+            index[p_node] = lowlink[p_node] = len(index)
+            stack.append(p_node)
+            on_stack.add(p_node)
+            work.append((p_node, iter(self._edges[p_node])))
+
+        for root in self._edges:
+            if root in index:
+                continue
+
+            work = []
+            visit(root)
+
+            while work:
+                node, neighbors = work[-1]
+
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        visit(neighbor)
+                        break
+                    elif neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    work.pop()
+
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                    if lowlink[node] == index[node]:
+                        component = []
+                        member = None
+
+                        while member != node:
+                            member = stack.pop()
+                            on_stack.remove(member)
+                            component.append(member)
+
+                        result.append(component)
+
+        return result
+
+    def _component_reachability(self, p_components, p_component_of, p_bits):
+        """
+        Returns for each component a bitset of the nodes that can be reached
+        from it by following at least one edge. Nodes of a component with a
+        cycle can reach each other.
+
+        Relies on the reverse topological order of p_components.
+        """
+        result = []
+
+        for number, component in enumerate(p_components):
+            reachable = 0
+            cyclic = False
+
+            for node in component:
+                for neighbor in self._edges[node]:
+                    other = p_component_of[neighbor]
+
+                    if other == number:
+                        cyclic = True
+                    else:
+                        reachable |= p_bits[neighbor] | result[other]
+
+            if cyclic:
+                for node in component:
+                    reachable |= p_bits[node]
+
+            result.append(reachable)
+
+        return result
+
+    def _redundant_edges(self, p_node, p_component_of, p_reach, p_bits):
+        """
+        Returns the outgoing edges of p_node that are made redundant by a path
+        through one of its other children.
+        """
+        groups = {}
+        for neighbor in self._edges[p_node]:
+            groups.setdefault(p_component_of[neighbor], []).append(neighbor)
+
+        # only children that cannot reach back to p_node count
+        valid = [number for number in groups
+                 if not p_reach[number] & p_bits[p_node]]
+
+        # prefix[i] | suffix[i + 1] is the union of all valid groups but i
+        prefix = [0]
+        for number in valid:
+            prefix.append(prefix[-1] | p_reach[number])
+
+        suffix = [0]
+        for number in reversed(valid):
+            suffix.append(suffix[-1] | p_reach[number])
+        suffix.reverse()
+
+        result = []
+        for i, number in enumerate(valid):
+            children = groups[number]
+
+            if (prefix[i] | suffix[i + 1]) & p_bits[children[0]]:
+                result += [(p_node, child) for child in children]
+            else:
+                # children on the same cycle, keep the edge to one of them
+                result += [(p_node, child) for child in children[1:]]
+
+        return result
+
     def transitively_reduce(self):
         """
         Performs a transitive reduction on the graph.
+
+        An edge to a child is removed when that child can also be reached
+        through another child, unless that other child can reach back to the
+        parent. When several children are on the same cycle, only the edge to
+        one of them is kept.
+
+        The reachability of each strongly connected component is calculated
+        once (as a bitset), so the graph is traversed only a single time.
         """
-        removals = set()
+        components = self._strongly_connected_components()
+        component_of = {}
 
-        for from_node, neighbors in self._edges.items():
-            childpairs = \
-                [(c1, c2) for c1 in neighbors for c2 in neighbors if c1 != c2]
+        for number, component in enumerate(components):
+            for node in component:
+                component_of[node] = number
 
-            for child1, child2 in childpairs:
-                if self.has_path(child1, child2) \
-                   and not self.has_path(child1, from_node):
-                    removals.add((from_node, child2))
+        bits = {node: 1 << i for i, node in enumerate(self._edges)}
+        reach = self._component_reachability(components, component_of, bits)
+
+        removals = []
+        for node in self._edges:
+            removals += self._redundant_edges(node, component_of, reach, bits)
 
         for edge in removals:
             self.remove_edge(edge[0], edge[1])
@@ -197,10 +369,10 @@ class DirectedGraph(object):
         """ Prints the graph in Dot format. """
         out = 'digraph g {\n'
 
-        for from_node, neighbors in self._edges.items():
+        for from_node in sorted(self._edges):
             out += "  {}\n".format(from_node)
 
-            for neighbor in neighbors:
+            for neighbor in sorted(self._edges[from_node]):
                 out += "  {} -> {}".format(from_node, neighbor)
 
                 edge_id = self.edge_id(from_node, neighbor)
@@ -45,6 +45,33 @@ def _to_base36(p_value):
     return base36 or alphabet[0]
 
 
+def table_size(p_count):
+    """
+    Returns the size of the hash table for a list with p_count items.
+
+    A larger key size is chosen if there's >1% chance of collision.
+    """
+    return _TABLE_SIZES[3] \
+        if p_count < _TABLE_SIZES[3] * 0.01 else _TABLE_SIZES[4]
+
+
+def hash_value(p_raw_value, p_size, p_used):
+    """
+    Calculates an identifier for the given string, which does not occur in
+    p_used (a container with identifiers that were handed out before).
+
+    Collisions are resolved by probing the next slot in the table.
+    """
+    hasher = sha1()
+    hasher.update(p_raw_value.encode('utf-8'))
+    value = int(hasher.hexdigest(), 16) % p_size
+
+    while _to_base36(value) in p_used:
+        value = (value + 1) % p_size
+
+    return _to_base36(value)
+
+
 def hash_list_values(p_list, p_key=lambda i: i):  # pragma: no branch
     """
     Calculates a unique value for each item in the list, these can be used as
@@ -59,25 +86,12 @@ def hash_list_values(p_list, p_key=lambda i: i):  # pragma: no branch
     """
     result = []
     used = set()
-
-    # choose a larger key size if there's >1% chance of collision
-    size = _TABLE_SIZES[3] \
-        if len(p_list) < _TABLE_SIZES[3] * 0.01 else _TABLE_SIZES[4]
+    size = table_size(len(p_list))
 
     for item in p_list:
-        # obtain the to-be-hashed value
-        raw_value = p_key(item)
-
-        # hash
-        hasher = sha1()
-        hasher.update(raw_value.encode('utf-8'))
-        hash_value = int(hasher.hexdigest(), 16) % size
-
-        # resolve possible collisions
-        while hash_value in used:
-            hash_value = (hash_value + 1) % size
+        uid = hash_value(p_key(item), size, used)
 
-        used.add(hash_value)
-        result.append((item, _to_base36(hash_value)))
+        used.add(uid)
+        result.append((item, uid))
 
     return result
@@ -23,8 +23,7 @@ today may have a higher importance than high priority tasks in the distant
 future.
 """
 
-from datetime import date
-
+from topydo.lib.Clock import clock
 from topydo.lib.Config import config
 
 IMPORTANCE_VALUE = {'A': 3, 'B': 2, 'C': 1}
@@ -32,7 +31,7 @@ IMPORTANCE_VALUE = {'A': 3, 'B': 2, 'C': 1}
 
 def is_due_next_monday(p_todo):
     """ Returns True when the given task is due next Monday. """
-    today = date.today()
+    today = clock().today()
     due = p_todo.due_date()
 
     return due and due.weekday() == 0 and today.weekday() >= 4 and \
@@ -80,17 +79,11 @@ def importance(p_todo, p_ignore_weekend=config().ignore_weekends()):
 def average_importance(p_todo, p_ignore_weekend=config().ignore_weekends()):
     own_importance = importance(p_todo, p_ignore_weekend)
 
-    average = 0
-    parents = []
-
-    try:
-        sum_importance = own_importance
-        parents = p_todo.parents()
-        for parent in parents:
-            sum_importance += importance(parent, p_ignore_weekend)
+    sum_importance = own_importance
+    parents = p_todo.parents()
+    for parent in parents:
+        sum_importance += importance(parent, p_ignore_weekend)
 
-        average = float(sum_importance) / float(1 + len(parents))
-    except AttributeError:
-        pass
+    average = float(sum_importance) / float(1 + len(parents))
 
     return max(own_importance, average)
@@ -16,9 +16,11 @@
 
 """ Utilities for formatting output with "list_format" option."""
 
-import arrow
 import re
 
+from functools import lru_cache
+
+from topydo.lib.Clock import clock
 from topydo.lib.Config import config
 from topydo.lib.Utils import get_terminal_size
 
@@ -38,11 +40,40 @@ def _filler(p_str, p_len):
     to_fill = p_len - len(p_str)
     return to_fill*' ' + p_str
 
-def humanize_date(p_datetime):
-    """ Returns a relative date string from a datetime object. """
-    now = arrow.now()
-    date = now.replace(day=p_datetime.day, month=p_datetime.month, year=p_datetime.year)
-    return date.humanize().replace('just now', 'today')
+@lru_cache(maxsize=1024)
+def _relative_date(p_date, p_today):
+    """
+    Describes the distance between p_date and p_today in words, e.g.
+    'in 2 days' or '3 months ago'.
+
+    Distances of more than six weeks are expressed in calendar months, so the
+    result does not only depend on the number of days in between.
+    """
+    days = (p_date - p_today).days
+    distance = abs(days)
+
+    if distance == 0:
+        return 'today'
+    elif distance == 1:
+        text = 'a day'
+    elif distance < 30:
+        text = '{} days'.format(distance)
+    elif distance < 45:
+        text = 'a month'
+    elif distance < 345:
+        months = abs((p_date.year - p_today.year) * 12 +
+                     p_date.month - p_today.month)
+        text = '{} months'.format(max(months, 2))
+    elif distance < 547:
+        text = 'a year'
+    else:
+        text = '{} years'.format(max(distance // 365, 2))
+
+    return 'in ' + text if days > 0 else text + ' ago'
+
+def humanize_date(p_date):
+    """ Returns a relative date string from a date object. """
+    return _relative_date(p_date, clock().today())
 
 def humanize_dates(p_due=None, p_start=None, p_creation=None):
     """
@@ -58,82 +89,59 @@ def humanize_dates(p_due=None, p_start=None, p_creation=None):
     if p_due:
         dates_list.append('due ' + humanize_date(p_due))
     if p_start:
-        now = arrow.now().date()
         dates_list.append('{} {}'.format(
-            'started' if p_start <= now else 'starts',
+            'started' if p_start <= clock().today() else 'starts',
             humanize_date(p_start)
         ))
 
     return ', '.join(dates_list)
 
-def _strip_placeholder_braces(p_matchobj):
-    """
-    Returns string with conditional braces around placeholder stripped and
-    percent sign glued into placeholder character.
-
-    Returned string is composed from 'start', 'before', 'placeholder', 'after',
-    'whitespace', and 'end' match-groups of p_matchobj. Conditional braces are
-    stripped from 'before' and 'after' groups. 'whitespace', 'start', and 'end'
-    groups are preserved without any change.
-
-    Using this function as an 'repl' argument in re.sub it is possible to turn:
-        %{(}B{)}
-    into:
-        (%B)
-    """
-    before = p_matchobj.group('before') or ''
-    placeholder = p_matchobj.group('placeholder')
-    after = p_matchobj.group('after') or ''
-    whitespace = p_matchobj.group('whitespace') or ''
-
-    return before + '%' + placeholder + after + whitespace
-
 def _unescape_percent_sign(p_str):
     """ Strips backslashes from escaped percent signs in p_str. """
-    unescaped_str = re.sub(r'\\%', '%', p_str)
-
-    return unescaped_str
+    return p_str.replace('\\%', '%')
 
 def _remove_redundant_spaces(p_str):
     """ Removes spaces surrunding <TAB> character (\t) from p_str. """
-    clean_str = re.sub(' *\t *', '\t', p_str)
+    return _remove_redundant_spaces.pattern.sub('\t', p_str)
 
-    return clean_str
+_remove_redundant_spaces.pattern = re.compile(' *\t *')
 
-def _truncate(p_str, p_repl):
+def _truncate(p_str, p_repl, p_columns):
     """
     Returns p_str with truncated and ended with '...' version of p_repl.
 
-    Place of the truncation is calculated depending on p_max_width.
+    Place of the truncation is calculated depending on p_columns.
     """
     # 4 is for '...' and an extra space at the end
-    text_lim = _columns() - len(p_str) - 4
-    truncated_str = re.sub(re.escape(p_repl), p_repl[:text_lim] + '...', p_str)
-
-    return truncated_str
+    text_lim = p_columns - len(p_str) - 4
+    return p_str.replace(p_repl, p_repl[:text_lim] + '...')
 
-def _right_align(p_str):
+def _right_align(p_str, p_columns):
     """
     Returns p_str with content after <TAB> character aligned right.
 
     Right alignment is done using proper number of spaces calculated from
-    'line_width' attribute.
+    p_columns.
     """
-    to_fill = _columns() - len(p_str)
-
-    if to_fill > 0:
-        p_str = re.sub('\t', ' '*to_fill, p_str)
-    else:
-        p_str = re.sub('\t', ' ', p_str)
-
-    return p_str
+    to_fill = p_columns - len(p_str)
+    return p_str.replace('\t', ' '*to_fill if to_fill > 0 else ' ')
 
 class ListFormatParser(object):
     """ Parser of format string. """
-    def __init__(self, p_todolist, p_format=None):
+    def __init__(self, p_todolist, p_format=None, p_columns=None):
+        """
+        p_columns is the width of the output lines. When omitted, the width
+        of the terminal is determined when the first line needs it.
+        """
         self.format_string = re.sub(r'\\t', '\t', p_format or config().list_format())
         self.todolist = p_todolist
+        self.columns = p_columns
         self.one_line = False
+
+        # tags that are left out by the %k placeholder
+        hidden_tags = set(config().hidden_tags() +
+                          [config().tag_start(), config().tag_due()])
+
         self.placeholders = {
             # absolute creation date
             'c': lambda t: t.creation_date().isoformat() if t.creation_date() else '',
@@ -163,8 +171,7 @@ class ListFormatParser(object):
             # list of tags (spaces) without hidden ones and due: and t:
             'k': lambda t: ' '.join([u'{}:{}'.format(tag, value)
                                      for tag, value in sorted(t.tags()) if
-                                     tag not in config().hidden_tags() +
-                                     [config().tag_start(), config().tag_due()]]),
+                                     tag not in hidden_tags]),
 
             # list of all tags (spaces)
             'K': lambda t: ' '.join([u'{}:{}'.format(tag, value)
@@ -201,81 +208,87 @@ class ListFormatParser(object):
 
     def _preprocess_format(self):
         """
-        Preprocess the format_string attribute.
-
-        Splits the format string on each placeholder and returns a list of
-        tuples containing substring, placeholder name, and function
-        retrieving content for placeholder (getter).
-
-        Relevant placeholder functions (getters) are taken from
-        'placeholders' attribute which is a dict. If no matching placeholder
-        is found in 'placeholders' getter is set to None. Getter and
-        placeholder are also always set to None in first element of the
-        returned list, because it never contain a real placeholder (read
-        re.split documentation for further information).
+        Compiles the format_string attribute into a list of segments.
+
+        Each segment is a tuple containing the text before the placeholder's
+        content, the function retrieving that content from a todo item
+        (getter), the text after it and whether the content may be truncated.
+        The texts before and after are only printed when the getter returns a
+        non-empty string. Literal text is stored in a segment without getter.
+
+        Unknown placeholders expand to an empty string, so they are left out
+        of the list altogether.
         """
         format_split = re.split(r'(?<!\\)%', self.format_string)
-        preprocessed_format = []
+        pattern = re.compile(MAIN_PATTERN.format(ph=r'\S'))
+        segments = []
 
         for idx, substr in enumerate(format_split):
-            if idx == 0:
-                getter = None
-                placeholder = None
-            else:
-                pattern = MAIN_PATTERN.format(ph=r'\S')
-                try:
-                    placeholder = re.match(pattern, substr).group('placeholder').strip('[]')
-                except AttributeError:
-                    placeholder = None
+            match = pattern.match(substr) if idx > 0 else None
+
+            if match:
+                placeholder = match.group('placeholder').strip('[]')
 
                 if placeholder == 'S':
                     self.one_line = True
 
                 try:
                     getter = self.placeholders[placeholder]
+                    before = _unescape_percent_sign(match.group('before') or '')
+                    after = _unescape_percent_sign(
+                        (match.group('after') or '') + match.group('whitespace'))
+                    segments.append((before, getter, after, placeholder == 'S'))
                 except KeyError:
-                    getter = None
-                    substr = re.sub(pattern, '', substr)
+                    pass
 
-            format_elem = (substr, placeholder, getter)
-            preprocessed_format.append(format_elem)
+                substr = substr[match.end():]
 
-        return preprocessed_format
+            if substr:
+                segments.append((_unescape_percent_sign(substr), None, '', False))
+
+        return segments
 
     def parse(self, p_todo):
         """
         Returns fully parsed string from 'format_string' attribute with all
         placeholders properly substituted by content obtained from p_todo.
 
-        It uses preprocessed form of 'format_string' (result of
+        It uses the compiled form of 'format_string' (result of
         ListFormatParser._preprocess_format) stored in 'format_list'
         attribute.
         """
         parsed_list = []
         repl_trunc = None
 
-        for substr, placeholder, getter in self.format_list:
-            repl = getter(p_todo) if getter else ''
-            pattern = MAIN_PATTERN.format(ph=placeholder)
+        for before, getter, after, truncate in self.format_list:
+            if getter is None:
+                parsed_list.append(before)
+                continue
+
+            repl = getter(p_todo)
 
-            if placeholder == 'S':
+            if truncate:
                 repl_trunc = repl
 
-            if repl == '':
-                substr = re.sub(pattern, '', substr)
-            else:
-                substr = re.sub(pattern, _strip_placeholder_braces, substr)
-                substr = re.sub(r'(?<!\\)%({ph}|\[{ph}\])'.format(ph=placeholder), repl, substr)
+            if repl:
+                parsed_list.append(before)
+                parsed_list.append(repl)
+                parsed_list.append(after)
+
+        parsed_str = ''.join(parsed_list)
+        has_tab = '\t' in parsed_str
 
-            parsed_list.append(substr)
+        if has_tab:
+            parsed_str = _remove_redundant_spaces(parsed_str)
 
-        parsed_str = _unescape_percent_sign(''.join(parsed_list))
-        parsed_str = _remove_redundant_spaces(parsed_str)
+        if self.one_line or has_tab:
+            if self.columns is None:
+                self.columns = _columns()
 
-        if self.one_line and len(parsed_str) >= _columns():
-            parsed_str = _truncate(parsed_str, repl_trunc)
+            if self.one_line and repl_trunc and len(parsed_str) >= self.columns:
+                parsed_str = _truncate(parsed_str, repl_trunc, self.columns)
 
-        if re.search('.*\t', parsed_str):
-            parsed_str = _right_align(parsed_str)
+            if has_tab:
+                parsed_str = _right_align(parsed_str, self.columns)
 
         return parsed_str.rstrip()
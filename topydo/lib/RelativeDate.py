@@ -16,10 +16,11 @@
 
 """ This module deals with relative dates (2d, 5y, Monday, today, etc.) """
 
-import calendar
 import re
 from datetime import date, timedelta
 
+from topydo.lib.Clock import clock
+
 
 def _add_months(p_sourcedate, p_months):
     """
@@ -29,6 +30,8 @@ def _add_months(p_sourcedate, p_months):
 
     https://stackoverflow.com/questions/4130922/how-to-increment-datetime-month-in-python
     """
+    import calendar
+
     month = p_sourcedate.month - 1 + p_months
     year = p_sourcedate.year + month // 12
     month = month % 12 + 1
@@ -61,7 +64,7 @@ def _convert_pattern(p_length, p_periodunit, p_offset=None):
     """
     result = None
 
-    p_offset = p_offset or date.today()
+    p_offset = p_offset or clock().today()
     p_length = int(p_length)
 
     if p_periodunit == 'd':
@@ -97,10 +100,11 @@ def _convert_weekday_pattern(p_weekday):
     target_day_string = p_weekday[:2].lower()
     target_day = day_value[target_day_string]
 
-    day = date.today().weekday()
+    today = clock().today()
+    day = today.weekday()
 
     shift = 7 - (day - target_day) % 7
-    return date.today() + timedelta(shift)
+    return today + timedelta(shift)
 
 
 def relative_date_to_date(p_date, p_offset=None):
@@ -115,7 +119,7 @@ def relative_date_to_date(p_date, p_offset=None):
     """
     result = None
     p_date = p_date.lower()
-    p_offset = p_offset or date.today()
+    p_offset = p_offset or clock().today()
 
     relative = re.match('(?P<length>-?[0-9]+)(?P<period>[dwmyb])$',
                         p_date, re.I)
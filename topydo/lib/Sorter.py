@@ -66,6 +66,31 @@ def get_field_function(p_field):
     return result
 
 
+class _Descending(object):
+    """
+    Wraps a sort key such that it compares the other way around, which allows
+    mixing ascending and descending fields in a single key tuple.
+    """
+    __slots__ = ['value']
+
+    def __init__(self, p_value):
+        self.value = p_value
+
+    def __eq__(self, p_other):
+        return self.value == p_other.value
+
+    def __lt__(self, p_other):
+        return p_other.value < self.value
+
+
+def _descending_key(p_value):
+    """ Returns a key that sorts p_value in descending order. """
+    if isinstance(p_value, (int, float)):
+        return -p_value
+
+    return _Descending(p_value)
+
+
 class Sorter(object):
     """
     This class sorts a todo list.
@@ -86,9 +111,9 @@ class Sorter(object):
     sort on priority and finally, if still equal an ascending sort on the
     creation field. Note that ascending is the default.
 
-    The idea is that a list of sort functions is gathered, where the most
-    specific search is done first. This relies on the fact that sorting is
-    stable.
+    The idea is that a list of sort functions is gathered, which together
+    make up a single key for each todo item. Descending fields are inverted
+    in that key, such that the list is sorted in one pass.
     """
 
     def __init__(self, p_sortstring="desc:priority"):
@@ -101,16 +126,19 @@ class Sorter(object):
         Sorts the list of todos given as a parameter, returns a new sorted
         list.
 
-        The list is traversed in reverse order, such that the most specific
-        sort operation is done first, relying on the stability of the sorted()
-        function.
+        The key of each todo item is calculated only once, todo items with
+        equal keys keep their original order.
         """
-        sorted_todos = p_todos
-        for function, order in reversed(self.functions):
-            sorted_todos = sorted(sorted_todos, key=function,
-                                  reverse=(order == 'desc'))
+        return sorted(p_todos, key=self.sort_key)
 
-        return sorted_todos
+    def sort_key(self, p_todo):
+        """
+        Returns a tuple with the values of all sort fields for the given todo
+        item, with descending fields inverted.
+        """
+        return tuple(function(p_todo) if order == 'asc'
+                     else _descending_key(function(p_todo))
+                     for function, order in self.functions)
 
     def _parse(self):
         """
@@ -18,8 +18,7 @@
 This module provides the Todo class.
 """
 
-from datetime import date
-
+from topydo.lib.Clock import clock
 from topydo.lib.Config import config
 from topydo.lib.TodoBase import TodoBase
 from topydo.lib.Utils import date_string_to_date
@@ -31,12 +30,62 @@ class Todo(TodoBase):
     base class, mainly by interpreting the start and due dates of task.
     """
 
-    def __init__(self, p_str):
-        TodoBase.__init__(self, p_str)
-        self.attributes = {}
+    __slots__ = ('_dates', '_attributes', 'todolist')
+
+    def __init__(self, p_str, p_lazy=False):
+        # tag name => parsed date, filled by get_date
+        self._dates = None
+
+        TodoBase.__init__(self, p_str, p_lazy)
+        self._attributes = None
+
+        # the TodoList this item belongs to, set when it's added to one
+        self.todolist = None
+
+    @property
+    def attributes(self):
+        """ A dictionary to store arbitrary data with this todo item. """
+        if self._attributes is None:
+            self._attributes = {}
+
+        return self._attributes
+
+    def set_source_text(self, p_text):
+        self._dates = None
+        super().set_source_text(p_text)
+
+    def set_tag(self, p_key, p_value="", p_force_add=False, p_old_value=""):
+        if self._dates:
+            self._dates.pop(p_key, None)
+
+        super().set_tag(p_key, p_value, p_force_add, p_old_value)
+
+    def remove_tag(self, p_key, p_value=""):
+        if self._dates:
+            self._dates.pop(p_key, None)
+
+        super().remove_tag(p_key, p_value)
+
+    def parents(self):
+        """
+        Returns the todos that (in)directly depend on this todo, according to
+        the todo list it belongs to.
+        """
+        return self.todolist.parents(self) if self.todolist else []
 
     def get_date(self, p_tag):
-        """ Given a date tag, return a date object. """
+        """
+        Given a date tag, return a date object. The parsed date is kept until
+        the tag is modified.
+        """
+        if self._dates is None:
+            self._dates = {}
+
+        try:
+            return self._dates[p_tag]
+        except KeyError:
+            pass
+
         string = self.tag_value(p_tag)
         result = None
 
@@ -45,6 +94,7 @@ class Todo(TodoBase):
         except ValueError:
             pass
 
+        self._dates[p_tag] = result
         return result
 
     def start_date(self):
@@ -61,7 +111,7 @@ class Todo(TodoBase):
         task has not yet been completed.
         """
         start = self.start_date()
-        return not self.is_completed() and (not start or start <= date.today())
+        return not self.is_completed() and (not start or start <= clock().today())
 
     def is_overdue(self):
         """
@@ -78,7 +128,7 @@ class Todo(TodoBase):
         """
         due = self.due_date()
         if due:
-            diff = due - date.today()
+            diff = due - clock().today()
             return diff.days
         return 0
 
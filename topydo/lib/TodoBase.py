@@ -35,27 +35,75 @@ class TodoBase(object):
     This is a base class, but supports enough to process any item in a todo.txt
     file. Derived classes add some interpretation to the tags that may appear
     in a todo item.
+
+    Large todo.txt or done.txt files result in many instances, so the parsed
+    attributes are kept in slots instead of a dictionary per instance.
+
+    When p_lazy is set, the source text is only parsed when one of the parsed
+    attributes is needed for the first time. Commands that touch a single
+    item of a large file then don't pay for parsing all the others.
     """
 
-    def __init__(self, p_src):
-        self.src = ""
-        self.fields = {}
+    _PARSED_SLOTS = ('_completed', '_completion_date', '_priority',
+                     '_creation_date', '_text', '_projects', '_contexts',
+                     '_tags')
+
+    __slots__ = ('src', ) + _PARSED_SLOTS
+
+    def __init__(self, p_src, p_lazy=False):
+        if p_lazy:
+            self.src = p_src.strip()
+
+            # only lines starting with 'x ' can be completed, so archiving
+            # doesn't need to parse the items that are still open
+            if not self.src.startswith('x '):
+                self._completed = False
+        else:
+            self.set_source_text(p_src)
+
+    def __getattr__(self, p_name):
+        """
+        Only called when an attribute is not set, which is the case for the
+        parsed attributes of a lazily constructed todo item. The source text
+        is parsed at that moment.
+        """
+        if p_name not in TodoBase._PARSED_SLOTS:
+            raise AttributeError(p_name)
 
-        self.set_source_text(p_src)
+        self._parse()
+        return object.__getattribute__(self, p_name)
+
+    @property
+    def fields(self):
+        """
+        Returns a dictionary with the parsed attributes of this todo item, in
+        the same structure as returned by TodoParser.parse_line. Modifying the
+        dictionary has no effect on the todo item.
+        """
+        return {
+            'completed': self._completed,
+            'completionDate': self._completion_date,
+            'priority': self._priority,
+            'creationDate': self._creation_date,
+            'text': self._text,
+            'projects': list(self._projects),
+            'contexts': list(self._contexts),
+            'tags': {key: list(values) for key, values in self._tags.items()},
+        }
 
     def tag_value(self, p_key, p_default=None):
         """
         Returns a tag value associated with p_key. Returns p_default if p_key
         does not exist (which defaults to None).
         """
-        return self.tag_values(p_key)[0] if p_key in self.fields['tags'] else p_default
+        return self.tag_values(p_key)[0] if p_key in self._tags else p_default
 
     def tag_values(self, p_key):
         """
         Returns a list of all tag values associated with p_key. Returns
         empty list if p_key does not exist.
         """
-        return self.fields['tags'][p_key] if p_key in self.fields['tags'] else []
+        return self._tags[p_key] if p_key in self._tags else []
 
     def has_tag(self, p_key, p_value=""):
         """
@@ -63,7 +111,7 @@ class TodoBase(object):
         value is passed, it will only return true when there exists a tag with
         the given key-value combination.
         """
-        tags = self.fields['tags']
+        tags = self._tags
         return p_key in tags and (p_value == "" or p_value in tags[p_key])
 
     def add_tag(self, p_key, p_value):
@@ -76,7 +124,7 @@ class TodoBase(object):
         with the given value are removed. If the value is empty, all tags with
         the given key are removed.
         """
-        tags = self.fields['tags']
+        tags = self._tags
 
         try:
             tags[p_key] = [t for t in tags[p_key] if p_value != "" and t != p_value]
@@ -103,7 +151,7 @@ class TodoBase(object):
             self.remove_tag(p_key, p_old_value)
             return
 
-        tags = self.fields['tags']
+        tags = self._tags
         value = p_old_value if p_old_value else self.tag_value(p_key)
 
         if not p_force_add and value:
@@ -140,7 +188,7 @@ class TodoBase(object):
         Returns a list of tuples with key-value pairs representing tags in
         this todo item.
         """
-        tags = self.fields['tags']
+        tags = self._tags
         return [(t, v) for t in tags for v in tags[t]]
 
     def set_priority(self, p_priority):
@@ -152,7 +200,7 @@ class TodoBase(object):
         """
         if not self.is_completed() and (p_priority is None or
                                         is_valid_priority(p_priority)):
-            self.fields['priority'] = p_priority
+            self._priority = p_priority
 
             priority_str = '' if p_priority is None else '(' + p_priority + ') '
             self.src = re.sub(r'^(\([A-Z]\) )?', priority_str, self.src)
@@ -161,11 +209,11 @@ class TodoBase(object):
         """
         Returns the priority of this todo, or None if no priority is set.
         """
-        return self.fields['priority']
+        return self._priority
 
     def text(self, p_with_tags=False):
         """ Returns the todo text with tags stripped off. """
-        return self.src if p_with_tags else self.fields['text']
+        return self.src if p_with_tags else self._text
 
     def source(self):
         """
@@ -177,26 +225,39 @@ class TodoBase(object):
     def set_source_text(self, p_text):
         """ Sets the todo source text. The text will be parsed again. """
         self.src = p_text.strip()
-        self.fields = parse_line(self.src)
+        self._parse()
+
+    def _parse(self):
+        """ Fills the parsed attributes based on the source text. """
+        fields = parse_line(self.src)
+
+        self._completed = fields['completed']
+        self._completion_date = fields['completionDate']
+        self._priority = fields['priority']
+        self._creation_date = fields['creationDate']
+        self._text = fields['text']
+        self._projects = tuple(fields['projects'])
+        self._contexts = tuple(fields['contexts'])
+        self._tags = fields['tags']
 
     def projects(self):
         """ Returns a set of projects associated with this todo item. """
-        return set(self.fields['projects'])
+        return set(self._projects)
 
     def contexts(self):
         """ Returns a set of contexts associated with this todo item. """
-        return set(self.fields['contexts'])
+        return set(self._contexts)
 
     def is_completed(self):
         """ Returns True iff this todo has been completed. """
-        return self.fields['completed']
+        return self._completed
 
     def completion_date(self):
         """
         Returns the completion date when the todo has been completed, or None
         otherwise.
         """
-        return self.fields['completionDate']
+        return self._completion_date
 
     def set_completed(self, p_completion_date=date.today()):
         """
@@ -206,8 +267,8 @@ class TodoBase(object):
         if not self.is_completed():
             self.set_priority(None)
 
-            self.fields['completed'] = True
-            self.fields['completionDate'] = p_completion_date
+            self._completed = True
+            self._completion_date = p_completion_date
 
             self.src = re.sub(r'^(\([A-Z]\) )?',
                               'x ' + p_completion_date.isoformat() + ' ',
@@ -217,7 +278,7 @@ class TodoBase(object):
         """
         Sets the creation date of a todo. Should be passed a date object.
         """
-        self.fields['creationDate'] = p_date
+        self._creation_date = p_date
 
         # not particularly pretty, but inspired by
         # http://bugs.python.org/issue1519638 non-existent matches trigger
@@ -230,4 +291,4 @@ class TodoBase(object):
 
     def creation_date(self):
         """ Returns the creation date of a todo. """
-        return self.fields['creationDate']
+        return self._creation_date
@@ -19,6 +19,9 @@ This module deals with todo.txt files.
 """
 
 import codecs
+import os
+
+from topydo.lib.Config import config
 
 
 class TodoFile(object):
@@ -48,15 +51,157 @@ class TodoFile(object):
 
         p_todos can be a list of todo items, or a string that is just written
         to the file.
+
+        With atomic writes enabled in the configuration, the todo items are
+        written to a temporary file first, which then replaces the todo.txt
+        file. So a crash halfway leaves the original file intact, and readers
+        never see a partially written file. When the file can't be replaced
+        that way, it's overwritten in place.
         """
-        todofile = codecs.open(self.path, 'w', encoding="utf-8")
+        if not config().atomic_write() or not self._write_atomic(p_todos):
+            todofile = codecs.open(self.path, 'w', encoding="utf-8")
+            self._write_todos(todofile, p_todos)
+            todofile.close()
 
+    @staticmethod
+    def _write_todos(p_file, p_todos):
+        """ Writes the todo items to the given (opened) file. """
         if p_todos is list:
             for todo in p_todos:
-                todofile.write(str(todo))
+                p_file.write(str(todo))
         else:
-            todofile.write(p_todos)
+            p_file.write(p_todos)
+
+        p_file.write("\n")
+
+    @staticmethod
+    def _replaceable(p_path):
+        """
+        Returns True when replacing the given file by a new one goes
+        unnoticed, i.e. it has no other hard links and the new file would get
+        the same owner and group.
+        """
+        try:
+            stat = os.stat(p_path)
+        except OSError:
+            # a new file
+            return True
+
+        if stat.st_nlink > 1:
+            return False
+
+        try:
+            return stat.st_uid == os.getuid() and stat.st_gid == os.getgid()
+        except AttributeError:
+            # no owners on this platform (Windows)
+            return True
+
+    def _write_atomic(self, p_todos):
+        """
+        Writes the todo items to a temporary file in the same directory, which
+        is synced to disk and renamed to the todo.txt file.
+
+        Returns False when the todo.txt file could not be replaced, for
+        instance because the directory is not writable. The todo.txt file is
+        left untouched in that case.
+        """
+        import tempfile
+
+        # replace the file a symbolic link points to, not the link itself
+        path = os.path.realpath(self.path)
+        directory, filename = os.path.split(path)
+
+        if not self._replaceable(path):
+            return False
+
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except OSError:
+            # a new file, created with the permissions open() would give it
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+
+        try:
+            handle, temp_path = tempfile.mkstemp(prefix='.' + filename + '.',
+                                                 dir=directory)
+        except OSError:
+            return False
+
+        try:
+            try:
+                todofile = codecs.open(handle, 'w', encoding='utf-8')
+            except BaseException:
+                os.close(handle)
+                raise
+
+            with todofile:
+                self._write_todos(todofile, p_todos)
+                todofile.flush()
+                os.fsync(todofile.fileno())
+
+            try:
+                os.chmod(temp_path, mode)
+
+                # os.rename doesn't replace existing files on Windows, but
+                # os.replace is not available in Python 3.2
+                getattr(os, 'replace', os.rename)(temp_path, path)
+            except OSError:
+                os.remove(temp_path)
+                return False
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        try:
+            # make the rename itself durable
+            dir_handle = os.open(directory or '.', os.O_RDONLY)
+
+            try:
+                os.fsync(dir_handle)
+            finally:
+                os.close(dir_handle)
+        except OSError:
+            # not supported on all platforms, e.g. Windows
+            pass
+
+        return True
+
+    @staticmethod
+    def _is_blank(p_file, p_size):
+        """
+        Returns True when the given (opened) file contains whitespace only.
+        The file is read backwards, so only its trailing whitespace is read.
+        """
+        offset = p_size
+
+        while offset > 0:
+            length = min(offset, 4096)
+            offset -= length
+            p_file.seek(offset)
+
+            if p_file.read(length).strip():
+                return False
+
+        return True
+
+    def append(self, p_todos):
+        """
+        Appends the given string to the todo.txt file, starting on a new line.
+        The existing contents of the file are not read, except for the
+        trailing whitespace. A file with only whitespace (such as an empty
+        list written by write()) is overwritten.
+        """
+        with open(self.path, 'a+b') as todofile:
+            size = todofile.seek(0, 2)
+
+            if self._is_blank(todofile, size):
+                todofile.truncate(0)
+            else:
+                todofile.seek(-1, 2)
 
-        todofile.write("\n")
+                if todofile.read(1) != b'\n':
+                    todofile.write(b'\n')
 
-        todofile.close()
+            todofile.write((p_todos + "\n").encode('utf-8'))
@@ -18,8 +18,6 @@
 A list of todo items.
 """
 
-import types
-
 from topydo.lib.Config import config
 from topydo.lib.TodoListBase import TodoListBase
 
@@ -67,8 +65,14 @@ class TodoList(TodoListBase):
         # initialize these first because the constructor calls add_list
         self._tododict = {}  # hash(todo) to todo lookup
         self._parentdict = {}  # dependency id => parent todo
+        self._childdict = {}  # dependency id => dict of child todos
+        self._iddict = {}  # dependency id => set of todos with that id tag
         self._depgraph = None
 
+        # hash(todo) => set of hashes of all its children or parents
+        self._children_cache = {}
+        self._parents_cache = {}
+
         super().__init__(p_todostrings)
 
     @_needs_dependencies
@@ -88,35 +92,125 @@ class TodoList(TodoListBase):
         Makes sure that the dependency graph is consistent according to the
         given todo.
         """
+        for dep_id in p_todo.tag_values('id'):
+            self._iddict.setdefault(dep_id, set()).add(p_todo)
+
         dep_id = p_todo.tag_value('id')
         # maintain dependency graph
         if dep_id:
             self._parentdict[dep_id] = p_todo
             self._depgraph.add_node(hash(p_todo))
 
-            # connect all tasks we have in memory so far that refer to this
-            # task
-            for dep in \
-                    [dep for dep in self._todos if dep.has_tag('p', dep_id)]:
-
-                self._depgraph.add_edge(hash(p_todo), hash(dep), dep_id)
+            # connect all tasks registered so far that refer to this task
+            for child in self._childdict.get(dep_id, []):
+                self._add_edge(hash(p_todo), hash(child), dep_id)
 
         for dep_id in p_todo.tag_values('p'):
+            self._add_child(dep_id, p_todo)
+
             try:
                 parent = self._parentdict[dep_id]
-                self._depgraph.add_edge(hash(parent), hash(p_todo), dep_id)
+                self._add_edge(hash(parent), hash(p_todo), dep_id)
             except KeyError:
                 pass
 
+    def _invalidate_closures(self, p_from, p_to):
+        """
+        Forgets the cached children of p_from and its parents, and the cached
+        parents of p_to and its children, because an edge between both nodes
+        is about to change (or just did).
+        """
+        if not self._children_cache and not self._parents_cache:
+            return
+
+        for node in self._depgraph.incoming_neighbors(p_from, True) | {p_from}:
+            self._children_cache.pop(node, None)
+
+        for node in self._depgraph.outgoing_neighbors(p_to, True) | {p_to}:
+            self._parents_cache.pop(node, None)
+
+    def _add_edge(self, p_from, p_to, p_dep_id):
+        """ Adds an edge to the dependency graph. """
+        self._invalidate_closures(p_from, p_to)
+        self._depgraph.add_edge(p_from, p_to, p_dep_id)
+        self._invalidate_closures(p_from, p_to)
+
+    def _remove_edge(self, p_from, p_to):
+        """ Removes an edge from the dependency graph. """
+        self._invalidate_closures(p_from, p_to)
+        self._depgraph.remove_edge(p_from, p_to)
+
+    def _closure(self, p_todo, p_reverse):
+        """
+        Returns the set of hashes of all children (or parents when p_reverse
+        is set) of the given todo. The result is cached until the dependencies
+        in that part of the graph change.
+        """
+        cache = self._parents_cache if p_reverse else self._children_cache
+        node = hash(p_todo)
+
+        if node not in cache:
+            cache[node] = self._depgraph.reachable_nodes(node, True, p_reverse,
+                                                         cache)
+
+        return cache[node]
+
+    def _add_child(self, p_dep_id, p_todo):
+        """ Registers that p_todo has a p tag with the given value. """
+        self._childdict.setdefault(p_dep_id, {})[p_todo] = None
+
+    def _remove_child(self, p_dep_id, p_todo):
+        """ Unregisters all p tags with the given value of p_todo. """
+        children = self._childdict.get(p_dep_id, {})
+        children.pop(p_todo, None)
+
+        if not children:
+            self._childdict.pop(p_dep_id, None)
+
+    def _remove_id(self, p_dep_id, p_todo):
+        """ Unregisters that p_todo has an id tag with the given value. """
+        todos = self._iddict.get(p_dep_id, set())
+        todos.discard(p_todo)
+
+        if not todos:
+            self._iddict.pop(p_dep_id, None)
+
     def _register_todo(self, p_todo):
         self._maintain_dep_graph(p_todo)
         self._tododict[hash(p_todo)] = p_todo
 
+    def _unregister_todo(self, p_todo, p_ids, p_parent_ids):
+        """
+        Removes the dependency administration of p_todo, given the values of
+        the id and p tags it had when it was registered.
+        """
+        for dep_id in p_ids:
+            self._remove_id(dep_id, p_todo)
+
+            if self._parentdict.get(dep_id) == p_todo:
+                del self._parentdict[dep_id]
+
+                for child in self._childdict.get(dep_id, []):
+                    self._remove_edge(hash(p_todo), hash(child))
+
+        for dep_id in p_parent_ids:
+            self._remove_child(dep_id, p_todo)
+
+            try:
+                parent = self._parentdict[dep_id]
+                self._remove_edge(hash(parent), hash(p_todo))
+            except KeyError:
+                pass
+
+        del self._tododict[hash(p_todo)]
+        self._children_cache.pop(hash(p_todo), None)
+        self._parents_cache.pop(hash(p_todo), None)
+
     def add_todos(self, p_todos):
         super().add_todos(p_todos)
 
-        for todo in self._todos:
-            todo.parents = types.MethodType(lambda i: self.parents(i), todo)
+        for todo in p_todos:
+            todo.todolist = self
 
             # only do administration when the dependency info is initialized,
             # otherwise we postpone it until it's really needed (through the
@@ -124,27 +218,133 @@ class TodoList(TodoListBase):
             if self._initialized:
                 self._register_todo(todo)
 
+    def erase(self):
+        """
+        Erases all todos from the list, the dependency information is rebuilt
+        when it's needed again.
+        """
+        for todo in self._todos:
+            if todo.todolist is self:
+                todo.todolist = None
+
+        super().erase()
+
+        self._initialized = False
+        self._tododict = {}
+        self._parentdict = {}
+        self._childdict = {}
+        self._iddict = {}
+        self._depgraph = None
+        self._children_cache = {}
+        self._parents_cache = {}
+
+    def append(self, p_todo, p_string):
+        """
+        Appends a text to the todo. The dependency administration is updated
+        when the text contains id or p tags.
+        """
+        ids = list(p_todo.tag_values('id'))
+        parent_ids = list(p_todo.tag_values('p'))
+
+        super().append(p_todo, p_string)
+
+        if self._initialized and (ids != p_todo.tag_values('id') or
+                                  parent_ids != p_todo.tag_values('p')):
+            self._unregister_todo(p_todo, ids, parent_ids)
+            self._register_todo(p_todo)
+
+    def remove_dependencies(self, p_todo):
+        """ Removes all dependencies with parents and children of a todo. """
+        if p_todo.has_tag('id') or p_todo.has_tag('p'):
+            self._remove_dependencies_many([p_todo])
+
+    @_needs_dependencies
+    def _remove_dependencies_many(self, p_todos):
+        """
+        Removes all dependencies with parents and children of the given todos.
+
+        This has the same outcome as removing them one by one, but every edge
+        is visited once and the ids of the parents that are left without
+        children are only removed at the end.
+        """
+        parents = set()
+
+        for todo in p_todos:
+            dep_id = todo.tag_value('id')
+
+            for child in self.children(todo, True):
+                child.remove_tag('p', dep_id)
+                self._remove_child(dep_id, child)
+                self._depgraph.remove_edge(hash(todo), hash(child))
+                parents.add(todo)
+
+            for parent in self.parents(todo, True):
+                parent_id = parent.tag_value('id')
+                todo.remove_tag('p', parent_id)
+                self._remove_child(parent_id, todo)
+                self._depgraph.remove_edge(hash(parent), hash(todo))
+                parents.add(parent)
+
+        for parent in parents:
+            dep_id = parent.tag_value('id')
+
+            if dep_id and not self._depgraph.has_edge_id(dep_id):
+                for value in parent.tag_values('id'):
+                    self._remove_id(value, parent)
+
+                parent.remove_tag('id')
+                del self._parentdict[dep_id]
+
+        if parents:
+            self._children_cache = {}
+            self._parents_cache = {}
+            self.dirty = True
+
+    def _detach(self, p_todos):
+        """
+        Removes the dependency administration of todo items that are about to
+        be deleted.
+        """
+        # the tags as they were registered, before removing the dependencies
+        tags = [(todo, list(todo.tag_values('id')), list(todo.tag_values('p')))
+                for todo in p_todos]
+
+        if any(ids or parent_ids for _, ids, parent_ids in tags):
+            self._remove_dependencies_many(p_todos)
+
+        for todo, ids, parent_ids in tags:
+            if self._initialized:
+                self._unregister_todo(todo, ids, parent_ids)
+
+            if todo.todolist is self:
+                todo.todolist = None
+
     def delete(self, p_todo):
         """ Deletes a todo item from the list. """
         try:
-            number = self._todos.index(p_todo)
-
-            if p_todo.has_tag('id'):
-                for child in self.children(p_todo):
-                    self.remove_dependency(p_todo, child)
-
-            if p_todo.has_tag('p'):
-                for parent in self.parents(p_todo):
-                    self.remove_dependency(parent, p_todo)
+            number = self._position(p_todo)
+            self._detach([p_todo])
 
             del self._todos[number]
-            self._update_todo_ids()
+            self._remove_todo_position(p_todo, number)
+            self._remove_todo_ids([p_todo])
 
             self.dirty = True
         except ValueError:
             # todo item couldn't be found, ignore
             pass
 
+    def delete_many(self, p_todos):
+        """
+        Deletes the given todo items from the list, including their
+        dependencies.
+        """
+        todos = [todo for todo in dict.fromkeys(p_todos)
+                 if todo in self._todo_position_map]
+
+        self._detach(todos)
+        super().delete_many(todos)
+
     @_needs_dependencies
     def add_dependency(self, p_from_todo, p_to_todo):
         """ Adds a dependency from task 1 to task 2. """
@@ -158,12 +358,8 @@ class TodoList(TodoListBase):
                 """
                 Returns True if there exists a todo with the given parent ID.
                 """
-                for todo in self._todos:
-                    number = str(p_id)
-                    if todo.has_tag('id', number) or todo.has_tag('p', number):
-                        return True
-
-                return False
+                number = str(p_id)
+                return number in self._iddict or number in self._childdict
 
             new_id = 1
             while id_exists(new_id):
@@ -198,9 +394,12 @@ class TodoList(TodoListBase):
             else:
                 dep_id = find_next_id()
                 p_from_todo.set_tag('id', dep_id)
+                self._iddict[dep_id] = {p_from_todo}
 
+            self._parentdict[dep_id] = p_from_todo
             p_to_todo.add_tag('p', dep_id)
-            self._depgraph.add_edge(hash(p_from_todo), hash(p_to_todo), dep_id)
+            self._add_child(dep_id, p_to_todo)
+            self._add_edge(hash(p_from_todo), hash(p_to_todo), dep_id)
             append_projects_to_subtodo()
             append_contexts_to_subtodo()
             self.dirty = True
@@ -212,9 +411,13 @@ class TodoList(TodoListBase):
 
         if dep_id:
             p_to_todo.remove_tag('p', dep_id)
-            self._depgraph.remove_edge(hash(p_from_todo), hash(p_to_todo))
+            self._remove_child(dep_id, p_to_todo)
+            self._remove_edge(hash(p_from_todo), hash(p_to_todo))
+
+            if not self._depgraph.has_edge_id(dep_id):
+                for value in p_from_todo.tag_values('id'):
+                    self._remove_id(value, p_from_todo)
 
-            if not self.children(p_from_todo, True):
                 p_from_todo.remove_tag('id')
                 del self._parentdict[dep_id]
 
@@ -226,8 +429,11 @@ class TodoList(TodoListBase):
         Returns a list of parent todos that (in)directly depend on the
         given todo.
         """
-        parents = self._depgraph.incoming_neighbors(
-            hash(p_todo), not p_only_direct)
+        if p_only_direct:
+            parents = self._depgraph.incoming_neighbors(hash(p_todo))
+        else:
+            parents = self._closure(p_todo, True)
+
         return [self._tododict[parent] for parent in parents]
 
     @_needs_dependencies
@@ -236,10 +442,23 @@ class TodoList(TodoListBase):
         Returns a list of child todos that the given todo (in)directly depends
         on.
         """
-        children = \
-            self._depgraph.outgoing_neighbors(hash(p_todo), not p_only_direct)
+        if p_only_direct:
+            children = self._depgraph.outgoing_neighbors(hash(p_todo))
+        else:
+            children = self._closure(p_todo, False)
+
         return [self._tododict[child] for child in children]
 
+    @_needs_dependencies
+    def parents_of_any(self, p_todos):
+        """
+        Returns the set of todos that (in)directly depend on at least one of
+        the given todos. The dependency graph is traversed only once.
+        """
+        parents = self._depgraph.reachable_from_any(
+            [hash(todo) for todo in p_todos], True)
+        return set(self._tododict[parent] for parent in parents)
+
     @_needs_dependencies
     def clean_dependencies(self):
         """
@@ -265,7 +484,12 @@ class TodoList(TodoListBase):
                 value = todo.tag_value('id')
                 if not self._depgraph.has_edge_id(value):
                     remove_tag(todo, 'id', value)
-                    del self._parentdict[value]
+                    self._remove_id(value, todo)
+
+                    # a todo with several id tags is registered as the
+                    # parent of the first one only
+                    if self._parentdict.get(value) is todo:
+                        del self._parentdict[value]
 
         def clean_orphan_relations():
             """
@@ -279,8 +503,14 @@ class TodoList(TodoListBase):
 
                     if not self._depgraph.has_edge(hash(parent), hash(todo)):
                         remove_tag(todo, 'p', value)
+                        self._remove_child(value, todo)
 
         self._depgraph.transitively_reduce()
+
+        # the reduction keeps all paths, but start with a clean slate anyway
+        self._children_cache = {}
+        self._parents_cache = {}
+
         clean_parent_relations()
         clean_orphan_relations()
 
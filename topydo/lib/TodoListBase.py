@@ -23,7 +23,6 @@ from datetime import date
 
 from topydo.lib import Filter
 from topydo.lib.Config import config
-from topydo.lib.HashListValues import hash_list_values
 from topydo.lib.PrettyPrinter import PrettyPrinter
 from topydo.lib.Todo import Todo
 from topydo.lib.View import View
@@ -51,8 +50,15 @@ class TodoListBase(object):
         self._todo_id_map = {}
         self._id_todo_map = {}
 
-        self.add_list(p_todostrings)
-        self.dirty = False
+        # identifiers are only calculated once they are needed
+        self._id_table_size = None
+
+        # todo => index in _todos, only valid for indices below _renumber_from
+        self._todo_position_map = {}
+        self._renumber_from = 0
+
+        self.add_list(p_todostrings, True)
+        self.mark_saved()
 
     def __iter__(self):
         """
@@ -79,6 +85,8 @@ class TodoListBase(object):
             result = None
 
             if config().identifiers() == 'text':
+                self._require_todo_ids()
+
                 try:
                     result = self._id_todo_map[p_identifier]
                 except KeyError:
@@ -144,8 +152,13 @@ class TodoListBase(object):
 
         return todos[0] if len(todos) else None
 
-    def add_list(self, p_srcs):
-        todos = [Todo(src) for src in p_srcs if re.search(r'\S', src)]
+    def add_list(self, p_srcs, p_lazy=False):
+        """
+        Parses the given todo strings and puts them at the end of the list.
+        With p_lazy, each todo is only parsed once it's actually used.
+        """
+        todos = [Todo(src, p_lazy) for src in p_srcs
+                 if src and not src.isspace()]
         self.add_todos(todos)
 
         return todos
@@ -157,24 +170,51 @@ class TodoListBase(object):
     def add_todos(self, p_todos):
         for todo in p_todos:
             self._todos.append(todo)
+            self._add_todo_position(todo)
 
-        self._update_todo_ids()
+        self._add_todo_ids(p_todos)
         self.dirty = True
 
     def delete(self, p_todo):
         """ Deletes a todo item from the list. """
         try:
-            number = self._todos.index(p_todo)
+            number = self._position(p_todo)
             del self._todos[number]
-            self._update_todo_ids()
+            self._remove_todo_position(p_todo, number)
+            self._remove_todo_ids([p_todo])
             self.dirty = True
         except ValueError:
             # todo item couldn't be found, ignore
             pass
 
+    def delete_many(self, p_todos):
+        """
+        Deletes the given todo items from the list, items that are not in the
+        list are ignored.
+
+        The list is rebuilt in a single pass, which is much faster than
+        deleting a large number of items one by one.
+        """
+        todos = set(todo for todo in p_todos
+                    if todo in self._todo_position_map)
+
+        if todos:
+            for todo in todos:
+                self._remove_todo_position(todo,
+                                           self._todo_position_map[todo])
+
+            self._todos = [todo for todo in self._todos if todo not in todos]
+            self._remove_todo_ids(todos)
+            self.dirty = True
+
     def erase(self):
         """ Erases all todos from the list. """
         self._todos = []
+        self._todo_id_map = {}
+        self._id_todo_map = {}
+        self._id_table_size = None
+        self._todo_position_map = {}
+        self._renumber_from = 0
         self.dirty = True
 
     def replace(self, p_todos):
@@ -196,7 +236,10 @@ class TodoListBase(object):
         if len(p_string) > 0:
             new_text = p_todo.source() + ' ' + p_string
             p_todo.set_source_text(new_text)
-            self._update_todo_ids()
+
+            # the text changed, so the todo item gets a new identifier
+            self._remove_todo_ids([p_todo])
+            self._add_todo_ids([p_todo])
             self.dirty = True
 
     def projects(self):
@@ -233,6 +276,33 @@ class TodoListBase(object):
     def set_dirty(self):
         self.dirty = True
 
+    def mark_saved(self):
+        """
+        Registers the current todo items as the contents of the backend store
+        (usually a todo.txt file).
+        """
+        self._saved_todos = list(self._todos)
+        self._saved_sources = [todo.src for todo in self._todos]
+        self.dirty = False
+
+    def appended_todos(self):
+        """
+        Returns the todo items that were added to the end of the list since it
+        was saved, or None when any of the saved todo items was modified,
+        removed or moved.
+
+        The backend store can then be brought up to date by only appending
+        the returned todo items to it.
+        """
+        count = len(self._saved_todos)
+        todos = self._todos[:count]
+
+        if todos != self._saved_todos or \
+                [todo.src for todo in todos] != self._saved_sources:
+            return None
+
+        return self._todos[count:]
+
     def todos(self):
         return self._todos
 
@@ -252,18 +322,73 @@ class TodoListBase(object):
         """
         try:
             if config().identifiers() == 'text':
+                self._require_todo_ids()
                 return self._todo_id_map[p_todo]
             else:
-                return self._todos.index(p_todo) + 1
+                return self._position(p_todo) + 1
         except (ValueError, KeyError) as ex:
             raise InvalidTodoException from ex
 
+    def _position(self, p_todo):
+        """
+        Returns the index of the given todo item in the list. Raises a
+        ValueError when the todo item is not in the list.
+
+        Positions are renumbered lazily: a deletion only marks the positions
+        after the deleted item as stale, they are recalculated as soon as one
+        of them is requested.
+        """
+        try:
+            position = self._todo_position_map[p_todo]
+        except KeyError as ke:
+            raise ValueError from ke
+
+        if position >= self._renumber_from:
+            for index in range(self._renumber_from, len(self._todos)):
+                self._todo_position_map[self._todos[index]] = index
+
+            self._renumber_from = len(self._todos)
+            position = self._todo_position_map[p_todo]
+
+        return position
+
+    def _add_todo_position(self, p_todo):
+        """ Registers the position of a todo item appended to the list. """
+        position = len(self._todos) - 1
+        self._todo_position_map[p_todo] = position
+
+        if self._renumber_from == position:
+            self._renumber_from += 1
+
+    def _remove_todo_position(self, p_todo, p_position):
+        """
+        Forgets the position of a deleted todo item, the positions of all items
+        after it become stale.
+        """
+        del self._todo_position_map[p_todo]
+        self._renumber_from = min(self._renumber_from, p_position)
+
+    def _require_todo_ids(self):
+        """
+        Calculates the identifiers of the todo items, unless that was done
+        before. From then on, the identifiers are maintained when todo items
+        are added or removed.
+        """
+        if self._id_table_size is None:
+            self._update_todo_ids()
+
     def _update_todo_ids(self):
+        """
+        Recalculates the identifiers of all todo items in the list.
+        """
+        from topydo.lib.HashListValues import hash_list_values, table_size
+
         # the idea is to have a hash that is independent of the position of the
         # todo. Use the text (without tags) of the todo to keep the id as
         # stable as possible (not influenced by priorities or due dates, etc.)
         self._todo_id_map = {}
         self._id_todo_map = {}
+        self._id_table_size = table_size(len(self._todos))
 
         uids = hash_list_values(self._todos, lambda t: t.text())
 
@@ -271,6 +396,47 @@ class TodoListBase(object):
             self._todo_id_map[todo] = uid
             self._id_todo_map[uid] = todo
 
+    def _add_todo_ids(self, p_todos):
+        """
+        Assigns identifiers to the given todo items, which have just been added
+        to the list. The identifiers of the other items remain untouched,
+        unless the list has grown such that a larger key size is needed.
+        """
+        if self._id_table_size is None:
+            return
+
+        from topydo.lib.HashListValues import hash_value, table_size
+
+        if table_size(len(self._todos)) != self._id_table_size:
+            self._update_todo_ids()
+            return
+
+        for todo in p_todos:
+            uid = hash_value(todo.text(), self._id_table_size,
+                             self._id_todo_map)
+            self._todo_id_map[todo] = uid
+            self._id_todo_map[uid] = todo
+
+    def _remove_todo_ids(self, p_todos):
+        """
+        Retires the identifiers of the given todo items, such that they can be
+        handed out again.
+        """
+        if self._id_table_size is None:
+            return
+
+        from topydo.lib.HashListValues import table_size
+
+        if table_size(len(self._todos)) != self._id_table_size:
+            self._update_todo_ids()
+            return
+
+        for todo in p_todos:
+            try:
+                del self._id_todo_map[self._todo_id_map.pop(todo)]
+            except KeyError:
+                pass
+
     def print_todos(self):
         """
         Returns a pretty-printed string (without colors) of the todo items in
@@ -33,7 +33,6 @@ _NORMAL_HEAD_MATCH = re.compile(
     r'(\((?P<priority>[A-Z])\) )?' + '((?P<creationDate>' + _DATE_MATCH +
     ') )?(?P<rest>.*)')
 
-_TAG_MATCH = re.compile('(?P<tag>[^:]+):(?P<value>.+)')
 _PROJECT_MATCH = re.compile(r'\+(\S*\w)')
 _CONTEXT_MATCH = re.compile(r'@(\S*\w)')
 
@@ -60,10 +59,10 @@ def parse_line(p_string):
         'tags': {},
     }
 
-    completed_head = _COMPLETED_HEAD_MATCH.match(p_string)
-    normal_head = _NORMAL_HEAD_MATCH.match(p_string)
+    completed_head = None
 
-    rest = p_string
+    if p_string.startswith('x '):
+        completed_head = _COMPLETED_HEAD_MATCH.match(p_string)
 
     if completed_head:
         result['completed'] = True
@@ -75,7 +74,8 @@ def parse_line(p_string):
         result['creationDate'] = date_string_to_date(creation_date)
 
         rest = completed_head.group('rest')
-    elif normal_head:
+    else:
+        normal_head = _NORMAL_HEAD_MATCH.match(p_string)
         result['priority'] = normal_head.group('priority')
 
         creation_date = normal_head.group('creationDate')
@@ -83,27 +83,36 @@ def parse_line(p_string):
 
         rest = normal_head.group('rest')
 
+    projects = result['projects']
+    contexts = result['contexts']
+    tags = result['tags']
+    text = []
+
     for word in rest.split():
-        project = _PROJECT_MATCH.match(word)
-        if project:
-            result['projects'].append(project.group(1))
-
-        context = _CONTEXT_MATCH.match(word)
-        if context:
-            result['contexts'].append(context.group(1))
-
-        tag = _TAG_MATCH.match(word)
-        if tag:
-            tag_name = tag.group('tag')
-            tag_value = tag.group('value')
+        first = word[0]
+
+        if first == '+':
+            project = _PROJECT_MATCH.match(word)
+            if project:
+                projects.append(project.group(1))
+        elif first == '@':
+            context = _CONTEXT_MATCH.match(word)
+            if context:
+                contexts.append(context.group(1))
+
+        # a tag has a non-empty name and value, separated by the first colon
+        colon = word.find(':')
+
+        if 0 < colon < len(word) - 1:
+            tag_name = word[:colon]
+            tag_value = word[colon + 1:]
             try:
-                result['tags'][tag_name].append(tag_value)
+                tags[tag_name].append(tag_value)
             except KeyError:
-                result['tags'][tag_name] = [tag_value]
+                tags[tag_name] = [tag_value]
         else:
-            result['text'] += word + ' '
+            text.append(word)
 
-    # strip trailing space from resulting text
-    result['text'] = result['text'][:-1]
+    result['text'] = ' '.join(text)
 
     return result
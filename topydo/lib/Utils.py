@@ -22,23 +22,22 @@ import re
 
 from collections import namedtuple
 from datetime import date
-
-# shutil.get_terminal_size was added to the standard library in Python 3.3
-try:
-    from shutil import get_terminal_size as _get_terminal_size  # pylint: disable=no-name-in-module
-except ImportError:
-    from backports.shutil_get_terminal_size import get_terminal_size as _get_terminal_size  # pylint: disable=import-error
+from functools import lru_cache
 
 
+@lru_cache(maxsize=4096)
 def date_string_to_date(p_date):
     """
     Given a date in YYYY-MM-DD, returns a Python date object. Returns None
     if the date is invalid.
+
+    Date objects are immutable, so todo items with the same date share the
+    same object.
     """
     result = None
 
     if p_date:
-        parsed_date = re.match(r'(\d{4})-(\d{2})-(\d{2})', p_date)
+        parsed_date = date_string_to_date.pattern.match(p_date)
         if parsed_date:
             result = date(
                 int(parsed_date.group(1)),  # year
@@ -50,6 +49,8 @@ def date_string_to_date(p_date):
 
     return result
 
+date_string_to_date.pattern = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
 
 def is_valid_priority(p_priority):
     return p_priority is not None and re.match(r'^[A-Z]$', p_priority) is not None
@@ -66,6 +67,12 @@ def get_terminal_size():
     Try to determine terminal size at run time. If that is not possible,
     returns the default size of 80x24.
     """
+    # shutil.get_terminal_size was added to the standard library in Python 3.3
+    try:
+        from shutil import get_terminal_size as _get_terminal_size  # pylint: disable=no-name-in-module
+    except ImportError:
+        from backports.shutil_get_terminal_size import get_terminal_size as _get_terminal_size  # pylint: disable=import-error
+
     try:
         sz = _get_terminal_size()
     except ValueError:
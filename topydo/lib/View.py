@@ -16,6 +16,10 @@
 
 """ A view is a list of todos, sorted and filtered. """
 
+import heapq
+
+from topydo.lib.Filter import LimitFilter
+
 
 class View(object):
     """
@@ -31,10 +35,27 @@ class View(object):
 
     @property
     def todos(self):
-        """ Returns a sorted and filtered list of todos in this view. """
-        result = self._sorter.sort(self._todolist.todos())
+        """
+        Returns a sorted and filtered list of todos in this view.
+
+        Filters up to the first limit filter do not depend on the order of
+        the todos, so they are applied before sorting. When the list is
+        limited, only the first items are selected instead of sorting the
+        complete list.
+        """
+        result = self._todolist.todos()
+        filters = list(self._filters)
+
+        while filters and not isinstance(filters[0], LimitFilter):
+            result = filters.pop(0).filter(result)
+
+        if filters and filters[0].limit >= 0:
+            result = heapq.nsmallest(filters.pop(0).limit, result,
+                                     key=self._sorter.sort_key)
+        else:
+            result = self._sorter.sort(result)
 
-        for _filter in self._filters:
+        for _filter in filters:
             result = _filter.filter(result)
 
         return result
@@ -24,9 +24,9 @@ from topydo.lib.ListFormat import ListFormatParser
 
 
 class PrettyPrinterFormatFilter(PrettyPrinterFilter):
-    def __init__(self, p_todolist, p_format=None):
+    def __init__(self, p_todolist, p_format=None, p_columns=None):
         super().__init__()
-        self.parser = ListFormatParser(p_todolist, p_format)
+        self.parser = ListFormatParser(p_todolist, p_format, p_columns)
 
     def filter(self, p_todo_str, p_todo):
         p_todo_str = self.parser.parse(p_todo)